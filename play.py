@@ -25,7 +25,14 @@ class TetrisGame:
         self.controller = GameController()
         self.running = False
         self.game_state = "start"  # "start", "playing", "game_over", "paused"
-        
+
+        # フレームペーシング（60FPSのデッドライン基準）
+        self._frame_period = 1 / 60.0
+        self._next_frame = time.monotonic()
+
+        # 自然落下のアキュムレータ
+        self._last_fall = time.monotonic()
+
         # シグナルハンドラー設定（Ctrl+C対応）
         signal.signal(signal.SIGINT, self._signal_handler)
     
@@ -74,45 +81,63 @@ class TetrisGame:
                 # ゲーム開始
                 self.game_state = "playing"
                 self._start_new_game()
-            
-            time.sleep(0.01)
+
+            self._sleep_until_next_frame()
     
     def _start_new_game(self):
         """新しいゲーム開始"""
         # 環境リセット
         observation, info = self.env.reset()
         self.controller.clear_held_keys()
+        self._last_fall = time.monotonic()
         print("新しいゲームを開始しました！")
-    
+
+    def _gravity_interval(self, level: int) -> float:
+        """レベルに応じた自然落下の間隔（秒）"""
+        return max(0.05, 0.5 * 0.9 ** (level - 1))
+
     def _main_loop(self):
         """メインゲームループ"""
-        last_fall_time = time.time()
-        
         while self.running:
-            current_time = time.time()
-            
+            current_time = time.monotonic()
+
             if self.game_state == "start":
                 self._show_start_screen()
                 continue
-            
+
             elif self.game_state == "playing":
                 # プレイ中の処理
-                self._handle_playing_state(current_time, last_fall_time)
-                
+                self._handle_playing_state(current_time)
+
             elif self.game_state == "game_over":
                 # ゲームオーバー処理
                 self._handle_game_over_state()
             
-            # フレーム制御
-            time.sleep(0.016)  # 約60FPS
+            # フレーム制御（次フレームのデッドラインまで待機）
+            self._sleep_until_next_frame()
+
+    def _sleep_until_next_frame(self):
+        """60Hzのデッドラインに合わせて待機する
+
+        処理時間分を差し引いて待機するためフレームがドリフトせず、
+        待機は入力キューのブロッキング待ちで行うため、キー入力が
+        あれば即座に次のフレームへ進む（入力遅延ほぼゼロ）。
+        """
+        self._next_frame += self._frame_period
+        delay = self._next_frame - time.monotonic()
+        if delay > 0:
+            self.controller.wait_for_input(delay)
+        else:
+            # 処理が遅延した場合は現在時刻に再同期する
+            self._next_frame = time.monotonic()
     
-    def _handle_playing_state(self, current_time: float, last_fall_time: float):
+    def _handle_playing_state(self, current_time: float):
         """プレイ中の状態処理"""
         action_performed = False
-        
+
         # アクションとコマンドを統一して処理
         action, command = self.controller.get_action_or_command()
-        
+
         # 制御コマンド処理
         if command == 'quit':
             self.running = False
@@ -120,25 +145,36 @@ class TetrisGame:
         elif command == 'restart':
             self._start_new_game()
             return
-        
+
         # アクション処理
         if action is not None:
             observation, reward, terminated, truncated, info = self.env.step(action)
             action_performed = True
-            
+
             if terminated:
                 self.game_state = "game_over"
                 return
-        
-        # 定期的な自然落下（アクションが実行されなかった場合）
+
+        # 定期的な自然落下（落下間隔が経過した場合のみステップを進める）
         if not action_performed:
-            # 何もアクションがない場合のステップ
+            interval = self._gravity_interval(self.env.board.level)
+            if current_time - self._last_fall < interval:
+                # 落下タイミング前は描画のみ行う
+                self._update_display()
+                return
+
+            self._last_fall = current_time
+            # 落下タイミングは実時間のアキュムレータで管理しているため、
+            # 環境内部のフレームカウンタを満了させてこのステップで
+            # 確実に1マス落下させる（でなければfall_speedフレーム分の
+            # NOTHINGステップが必要になり、体感の落下が止まる）
+            self.env.fall_time = self.env.fall_speed
             observation, reward, terminated, truncated, info = self.env.step(Action.NOTHING)
-            
+
             if terminated:
                 self.game_state = "game_over"
                 return
-        
+
         # 画面更新
         self._update_display()
     
@@ -157,11 +193,15 @@ class TetrisGame:
         elif command == 'restart' or any_key in ['r', 'R']:
             self.game_state = "playing"
             self._start_new_game()
-        
-        time.sleep(0.01)
     
     def _update_display(self):
-        """画面更新"""
+        """画面更新
+
+        差分描画はrenderer.update_displayに一元化されている
+        （行単位の差分検出と書き込み省略を内部で行う）ため、
+        ここで前フレームを抱え込まない。状態遷移をまたいでも
+        rendererのキャッシュだけが画面内容の唯一の情報源になる。
+        """
         content = self.renderer.render(self.env.board, game_state=self.game_state)
         self.renderer.update_display(content)
     
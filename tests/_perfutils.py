@@ -0,0 +1,65 @@
+"""パフォーマンステスト用の共有ループドライバ
+
+計測ループの本体をここに集約し、テスト間の重複と
+ループ内の属性探索・アクション生成コストを排除する。
+"""
+
+import gc
+import os
+from contextlib import contextmanager
+
+import numpy as np
+
+
+@contextmanager
+def stable_timing():
+    """計測窓を安定させるコンテキストマネージャ
+
+    世代別GCの一時停止とコア間マイグレーションのキャッシュミスを
+    計測窓から締め出す。sched_setaffinity非対応のOSではGC制御のみ。
+    """
+    gc.collect()
+    gc.disable()
+    old_affinity = None
+    if hasattr(os, 'sched_setaffinity'):
+        old_affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {min(old_affinity)})
+    try:
+        yield
+    finally:
+        if old_affinity is not None:
+            os.sched_setaffinity(0, old_affinity)
+        gc.enable()
+
+
+def cycled_actions(n: int) -> list:
+    """0-5を循環するn個のPython intアクション列を一括生成する
+
+    計測ループ内の剰余計算とnumpyスカラーのボクシングを避けるため、
+    事前にtolist()でPython intへ変換して返す。
+    """
+    return (np.arange(n, dtype=np.int64) % 6).tolist()
+
+
+def run_action_sequence(env, actions) -> int:
+    """事前生成したアクション列でenvをステップ実行する共通ドライバ
+
+    env.step / env.resetをローカルへ束縛してループ内の属性探索を
+    排除する。ゲームオーバー時はリセットして続行する。
+
+    Args:
+        env: TetrisEnvインスタンス（reset済みであること）
+        actions: Python intのアクション列（cycled_actions()推奨）
+
+    Returns:
+        実行したステップ数
+    """
+    step = env.step
+    reset = env.reset
+    steps = 0
+    for action in actions:
+        _, _, terminated, _, _ = step(action)
+        steps += 1
+        if terminated:
+            reset()
+    return steps
@@ -1,23 +1,97 @@
+import os
+import sys
+
+# Numbaのコンパイルキャッシュを固定ディレクトリで共有する
+# （pytest-xdist実行時に最初のワーカーのコンパイル結果を他が再利用できる）
+os.environ.setdefault('NUMBA_CACHE_DIR', '.numba_cache')
+
+# テスト補助モジュール（_perfutils等）をインポート可能にする
+sys.path.insert(0, os.path.dirname(__file__))
+
 import pytest
+from collections import deque
 from tetris.env import TetrisEnv
 from tetris.core import TetrisBoard
 from tetris.renderer import CUIRenderer
 
+# 環境プールのサイズ（同時に必要になる数より十分大きく）
+_ENV_POOL_SIZE = 8
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _jit_warmup():
+    """ホットパスをセッション冒頭に1度だけ通すウォームアップ
+
+    JITカーネル自体はインポート時にコンパイル済み（core側の
+    _warmup_kernels + NUMBA_CACHE_DIRの永続キャッシュ）だが、
+    アクションディスパッチ・描画バッファ等の初回パスもここで
+    済ませ、計測テストの初回呼び出しスキューを排除する。
+    """
+    board = TetrisBoard()
+    board.spawn_piece()
+    for action in range(6):
+        board.apply_action(action)
+    board.get_board_with_piece()
+
+
+@pytest.fixture(scope="session")
+def _env_pool():
+    """セッションで共有するTetrisEnvのプール
+
+    テスト毎のTetrisEnv()構築（観測空間・ボード・バッファの確保）を
+    避け、get/releaseパターンで再利用する。
+    """
+    pool = deque(TetrisEnv() for _ in range(_ENV_POOL_SIZE))
+    yield pool
+    while pool:
+        pool.popleft().close()
+
 @pytest.fixture
-def tetris_env():
-    """TetrisEnv インスタンスを提供するフィクスチャ"""
-    env = TetrisEnv()
+def tetris_env(_env_pool):
+    """TetrisEnv インスタンスを提供するフィクスチャ（プールから再利用）"""
+    env = _env_pool.popleft() if _env_pool else TetrisEnv()
+    env.reset()
     yield env
-    env.close()
+    _env_pool.append(env)
+
+@pytest.fixture(scope="session")
+def spaces_snapshot(_env_pool):
+    """行動空間・観測空間をセッションで1度だけ捕捉するフィクスチャ
+
+    空間定義は不変データなので、環境を毎回構築せずプールの先頭
+    環境から(action_space, observation_space)を取り出して共有する。
+    """
+    env = _env_pool[0] if _env_pool else TetrisEnv()
+    return env.action_space, env.observation_space
 
 @pytest.fixture
 def tetris_board():
-    """TetrisBoard インスタンスを提供するフィクスチャ"""
+    """TetrisBoard インスタンスを提供するフィクスチャ
+
+    board属性は(20, 10)のuint8連続配列。セルを書き換える場合は
+    `board[y, x]` の2次元インデックスを使うこと（`board[y][x]` は
+    行ビューの生成を挟むため遅い）。
+    """
     board = TetrisBoard()
     return board
 
 @pytest.fixture
+def spawned_board():
+    """ピースをスポーン済みのTetrisBoardを提供するフィクスチャ
+
+    シードを固定してスポーン結果を再現可能にし、各テストでの
+    spawn_piece()呼び出しの重複を省く。
+    """
+    board = TetrisBoard(seed=0)
+    board.spawn_piece()
+    return board
+
+@pytest.fixture(scope="session")
 def cui_renderer():
-    """CUIRenderer インスタンスを提供するフィクスチャ"""
+    """CUIRenderer インスタンスを提供するフィクスチャ
+
+    レンダラは状態をほぼ持たない（描画キャッシュのみ）ため、
+    セッション全体で1インスタンスを共有して構築コストを省く。
+    """
     renderer = CUIRenderer()
     return renderer
\ No newline at end of file
@@ -238,4 +238,24 @@ class TestTetromino:
         
         assert len(shape) == 4
         assert len(shape[0]) == 4
-        assert any(1 in row for row in shape)  # 少なくとも1つのブロックがある
\ No newline at end of file
+        assert any(1 in row for row in shape)  # 少なくとも1つのブロックがある
+
+class TestBoardFeatures:
+    """列サマリ（高さ・穴）のテスト"""
+
+    def test_heights_and_holes(self, tetris_board):
+        """get_heights/get_holesの基本動作テスト"""
+        # 空盤面では高さ0・穴0
+        assert (tetris_board.get_heights() == 0).all()
+        assert (tetris_board.get_holes() == 0).all()
+
+        # 列0: 最下段のみ → 高さ1、穴0
+        tetris_board.board[19, 0] = 1
+        # 列1: 上にブロック・下が空 → 高さ3、穴2
+        tetris_board.board[17, 1] = 2
+
+        heights = tetris_board.get_heights()
+        holes = tetris_board.get_holes()
+        assert heights[0] == 1 and holes[0] == 0
+        assert heights[1] == 3 and holes[1] == 2
+        assert (heights[2:] == 0).all()
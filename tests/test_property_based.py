@@ -1,138 +1,196 @@
 import pytest
 import numpy as np
-from hypothesis import given, strategies as st, settings, assume
+from functools import lru_cache
+from hypothesis import Phase, assume, given, strategies as st, settings
 from tetris.env import TetrisEnv
 from tetris.core import TetrisBoard, Action, TetrominoType, Tetromino
 
+# explainフェーズはreset()の重い環境で特に遅いため無効化する。
+# 各テストの@settings(max_examples=...)は本プロファイルを継承する。
+settings.register_profile(
+    "fast",
+    deadline=None,
+    phases=[Phase.generate, Phase.shrink],
+    print_blob=False,
+)
+settings.load_profile("fast")
+
+# enumのリスト化はexample毎に繰り返す必要がないため一度だけ行う
+_TETROMINO_TYPES = list(TetrominoType)
+_ACTIONS = list(Action)
+
+
+@lru_cache(maxsize=None)
+def _rotation_after_four(tetromino_type, rotation):
+    """(type, rotation)から4回rotate()した後のrotationを返す
+
+    rotate()は決定論的なので組み合わせ28通りをメモ化し、
+    Hypothesisの再試行での再計算を省く。
+    """
+    piece = Tetromino(tetromino_type, 5, 5)
+    piece.rotation = rotation
+    for _ in range(4):
+        piece = piece.rotate()
+    return piece.rotation
+
+
+@pytest.fixture(scope="class")
+def shared_board():
+    """位置検証テストで共有する空のTetrisBoard
+
+    is_valid_positionは盤面を変更しないため安全に共有できる。
+    """
+    return TetrisBoard()
+
+
+@pytest.fixture(scope="class")
+def shared_env():
+    """Hypothesisの全exampleで共有するTetrisEnv
+
+    example毎の構築・破棄はテスト時間を支配するため、
+    1環境をreset()で使い回す。
+    """
+    env = TetrisEnv()
+    yield env
+    env.close()
+
+
+@pytest.fixture(scope="class")
+def obs_schema(shared_env):
+    """観測のキー・型・shapeのスナップショット
+
+    スキーマはreset間で不変なため、example毎に再計算せず
+    一度だけ採取して全examplesで参照する。
+    """
+    obs, _ = shared_env.reset()
+    return (
+        set(obs),
+        {k: type(v) for k, v in obs.items()},
+        {k: getattr(v, 'shape', None) for k, v in obs.items()},
+    )
+
+
+@pytest.fixture(scope="class")
+def shared_env_pair():
+    """決定論テスト用に2環境を共有するフィクスチャ"""
+    env1, env2 = TetrisEnv(), TetrisEnv()
+    yield env1, env2
+    env1.close()
+    env2.close()
+
 
 class TestPropertyBasedTesting:
     """プロパティベーステスト - 不変条件の検証"""
 
-    @given(st.integers(min_value=0, max_value=5))
+    @given(st.sampled_from(_ACTIONS))
     @settings(max_examples=100)
-    def test_action_invariants(self, action):
+    def test_action_invariants(self, shared_env, action):
         """アクション実行の不変条件テスト"""
-        env = TetrisEnv()
-        try:
-            observation, info = env.reset()
-            initial_board_shape = observation["board"].shape
-            initial_score = observation["score"]
-            
-            # アクション実行
-            obs, reward, terminated, truncated, info = env.step(action)
-            
-            # 不変条件の確認
-            assert obs["board"].shape == initial_board_shape, "Board shape changed"
-            assert obs["score"] >= initial_score, "Score decreased"
-            assert obs["lines_cleared"] >= observation["lines_cleared"], "Lines cleared decreased"
-            assert obs["level"] >= observation["level"], "Level decreased"
-            assert isinstance(reward, (int, float)), "Reward not numeric"
-            assert isinstance(terminated, bool), "Terminated not boolean"
-            assert isinstance(truncated, bool), "Truncated not boolean"
-            
-        finally:
-            env.close()
+        env = shared_env
+        observation, info = env.reset()
+        initial_board_shape = observation["board"].shape
+        initial_score = observation["score"]
+
+        # アクション実行
+        obs, reward, terminated, truncated, info = env.step(action)
 
-    @given(st.lists(st.integers(min_value=0, max_value=5), min_size=1, max_size=50))
+        # 不変条件の確認
+        assert obs["board"].shape == initial_board_shape, "Board shape changed"
+        assert obs["score"] >= initial_score, "Score decreased"
+        assert obs["lines_cleared"] >= observation["lines_cleared"], "Lines cleared decreased"
+        assert obs["level"] >= observation["level"], "Level decreased"
+        assert isinstance(reward, (int, float)), "Reward not numeric"
+        assert isinstance(terminated, bool), "Terminated not boolean"
+        assert isinstance(truncated, bool), "Truncated not boolean"
+
+    @given(st.lists(st.sampled_from(_ACTIONS), min_size=1, max_size=50))
     @settings(max_examples=50)
-    def test_action_sequence_properties(self, action_sequence):
+    def test_action_sequence_properties(self, shared_env, action_sequence):
         """アクションシーケンスの特性テスト"""
-        env = TetrisEnv()
-        try:
-            observation, info = env.reset()
-            initial_state = observation.copy()
-            
-            scores = [observation["score"]]
-            lines_cleared = [observation["lines_cleared"]]
-            
-            for action in action_sequence:
-                obs, reward, terminated, truncated, info = env.step(action)
-                scores.append(obs["score"])
-                lines_cleared.append(obs["lines_cleared"])
-                
-                if terminated:
-                    observation, info = env.reset()
-                    break
-            
-            # 単調性の確認
-            assert all(s2 >= s1 for s1, s2 in zip(scores[:-1], scores[1:])), "Score not monotonic"
-            assert all(l2 >= l1 for l1, l2 in zip(lines_cleared[:-1], lines_cleared[1:])), "Lines cleared not monotonic"
-            
-        finally:
-            env.close()
+        env = shared_env
+        observation, info = env.reset()
+
+        # appendの再確保を避けるため長さ既知のバッファへ直接書き込む
+        n = len(action_sequence)
+        scores = np.empty(n + 1, dtype=np.int64)
+        lines_cleared = np.empty(n + 1, dtype=np.int64)
+        scores[0] = observation["score"]
+        lines_cleared[0] = observation["lines_cleared"]
+        recorded = 1
+
+        for action in action_sequence:
+            obs, reward, terminated, truncated, info = env.step(action)
+            scores[recorded] = obs["score"]
+            lines_cleared[recorded] = obs["lines_cleared"]
+            recorded += 1
+
+            if terminated:
+                observation, info = env.reset()
+                break
+
+        # 単調性の確認（np.diffでC側の一括比較に置き換え）
+        assert (np.diff(scores[:recorded]) >= 0).all(), "Score not monotonic"
+        assert (np.diff(lines_cleared[:recorded]) >= 0).all(), "Lines cleared not monotonic"
 
     @given(st.integers(min_value=1, max_value=1000))
     @settings(max_examples=20)
-    def test_reset_consistency(self, seed):
+    def test_reset_consistency(self, shared_env, seed):
         """リセット一貫性テスト"""
-        env = TetrisEnv()
-        try:
-            # 同じシードで2回リセット
-            obs1, info1 = env.reset(seed=seed)
-            obs2, info2 = env.reset(seed=seed)
-            
-            # 初期状態が同じであることを確認
-            assert obs1["score"] == obs2["score"], "Score not consistent after reset"
-            assert obs1["lines_cleared"] == obs2["lines_cleared"], "Lines cleared not consistent"
-            assert obs1["level"] == obs2["level"], "Level not consistent"
-            assert np.array_equal(obs1["board"], obs2["board"]), "Board not consistent after reset"
-            
-        finally:
-            env.close()
+        env = shared_env
 
-    @given(st.integers(min_value=0, max_value=19), st.integers(min_value=0, max_value=9))
-    @settings(max_examples=100)
-    def test_board_bounds_invariant(self, y, x):
-        """ボード境界不変条件テスト"""
-        board = TetrisBoard()
-        
-        # ボード内の座標であることを前提
-        assume(0 <= y < board.height and 0 <= x < board.width)
-        
-        # ボードの値が有効範囲内であることを確認
-        board_value = board.board[y][x]
-        assert 0 <= board_value <= 7, f"Invalid board value {board_value} at ({y}, {x})"
-
-    @given(st.lists(st.integers(min_value=0, max_value=5), min_size=10, max_size=100))
+        # 同じシードで2回リセット
+        obs1, info1 = env.reset(seed=seed)
+        obs2, info2 = env.reset(seed=seed)
+
+        # 初期状態が同じであることを確認
+        assert obs1["score"] == obs2["score"], "Score not consistent after reset"
+        assert obs1["lines_cleared"] == obs2["lines_cleared"], "Lines cleared not consistent"
+        assert obs1["level"] == obs2["level"], "Level not consistent"
+        assert np.array_equal(obs1["board"], obs2["board"]), "Board not consistent after reset"
+
+    def test_board_bounds_invariant(self):
+        """ボード境界不変条件テスト
+
+        不変条件は「全セルが[0,7]」で座標に依存しないため、
+        セル単位のexample生成をやめてufunc1回の一括検証で確認する。
+        """
+        board = TetrisBoard().board
+        assert np.logical_and(board >= 0, board <= 7).all(), "Invalid board value out of [0, 7]"
+
+    @given(st.lists(st.sampled_from(_ACTIONS), min_size=10, max_size=100))
     @settings(max_examples=30)
-    def test_game_over_properties(self, actions):
+    def test_game_over_properties(self, shared_env, actions):
         """ゲームオーバー特性テスト"""
-        env = TetrisEnv()
-        try:
-            observation, info = env.reset()
-            game_over_occurred = False
-            
-            for action in actions:
-                obs, reward, terminated, truncated, info = env.step(action)
-                
-                if terminated:
-                    game_over_occurred = True
-                    
-                    # ゲームオーバー時の特性確認
-                    assert obs["score"] >= 0, "Negative score at game over"
-                    assert obs["lines_cleared"] >= 0, "Negative lines cleared at game over"
-                    assert obs["level"] >= 1, "Invalid level at game over"
-                    
-                    # リセット後は正常状態に戻る
-                    reset_obs, reset_info = env.reset()
-                    assert reset_obs["score"] == 0, "Score not reset to 0"
-                    assert reset_obs["lines_cleared"] == 0, "Lines cleared not reset to 0"
-                    assert reset_obs["level"] == 1, "Level not reset to 1"
-                    break
-            
-        finally:
-            env.close()
+        env = shared_env
+        observation, info = env.reset()
+        game_over_occurred = False
+
+        for action in actions:
+            obs, reward, terminated, truncated, info = env.step(action)
+
+            if terminated:
+                game_over_occurred = True
+
+                # ゲームオーバー時の特性確認
+                assert obs["score"] >= 0, "Negative score at game over"
+                assert obs["lines_cleared"] >= 0, "Negative lines cleared at game over"
+                assert obs["level"] >= 1, "Invalid level at game over"
+                # リセット後の初期値はtest_reset_zeroes_countersで一度だけ検証する
+                break
 
-    @given(st.integers(min_value=0, max_value=6))
+    def test_reset_zeroes_counters(self, shared_env):
+        """リセット後にカウンタが初期値へ戻ることの検証（example反復は不要）"""
+        reset_obs, reset_info = shared_env.reset()
+        assert reset_obs["score"] == 0, "Score not reset to 0"
+        assert reset_obs["lines_cleared"] == 0, "Lines cleared not reset to 0"
+        assert reset_obs["level"] == 1, "Level not reset to 1"
+
+    @given(st.sampled_from(_TETROMINO_TYPES))
     @settings(max_examples=50)
-    def test_tetromino_type_properties(self, type_value):
+    def test_tetromino_type_properties(self, tetromino_type):
         """テトロミノタイプ特性テスト"""
-        # 有効なテトロミノタイプのみテスト
-        assume(type_value < len(TetrominoType))
-        
-        tetromino_type = list(TetrominoType)[type_value]
         piece = Tetromino(tetromino_type)
-        
+
         # テトロミノの基本特性
         assert piece.type == tetromino_type, "Type mismatch"
         assert isinstance(piece.x, int), "X coordinate not integer"
@@ -142,157 +200,148 @@ class TestPropertyBasedTesting:
         assert all(len(row) == 4 for row in piece.shape), "Shape rows not length 4"
 
     @given(st.integers(min_value=-5, max_value=15), st.integers(min_value=-5, max_value=25))
-    @settings(max_examples=100)
-    def test_position_validation_properties(self, x, y):
-        """位置検証特性テスト"""
-        board = TetrisBoard()
-        
-        # ランダムなテトロミノを作成
-        tetromino_type = TetrominoType.I
-        piece = Tetromino(tetromino_type, x, y)
+    @settings(max_examples=50)
+    def test_position_validation_out_of_bounds(self, shared_board, x, y):
+        """位置検証特性テスト（盤外は必ず無効）
+
+        I字・rotation=0の実セルはdx=0..3, dy=1。壁・床を越える座標に
+        限定してexampleを生成し、no-op分岐のexample浪費を避ける。
+        """
+        board = shared_board
+        assume(x < -3 or x + 3 >= board.width or y + 1 >= board.height)
+
+        piece = Tetromino(TetrominoType.I, x, y)
         piece.rotation = 0
-        
-        is_valid = board.is_valid_position(piece)
-        
-        # 境界条件の確認
-        # スポーン時はyが負の値でも有効な場合があるため、严密なチェックは適用しない
-        pass  # 実際のロジックはゲーム内で適切に処理される
-
-    @given(st.integers(min_value=0, max_value=3))
+        assert not board.is_valid_position(piece), f"Out-of-bounds ({x}, {y}) reported valid"
+
+    @given(st.integers(min_value=0, max_value=6), st.integers(min_value=0, max_value=18))
     @settings(max_examples=50)
-    def test_rotation_properties(self, rotation):
-        """回転特性テスト"""
-        board = TetrisBoard()
-        
-        for tetromino_type in TetrominoType:
-            piece = Tetromino(tetromino_type, 5, 5)
-            piece.rotation = rotation
-            
-            # 4回回転すると元に戻る特性
-            original_shape = piece.shape.copy()
-            current_piece = piece
-            
-            for _ in range(4):
-                current_piece = current_piece.rotate()
-            
-            # 同じ形状に戻ることを確認（位置によって異なる場合があるので、形状のみ比較）
-            assert current_piece.rotation == piece.rotation, "Rotation not cyclic"
-
-    @given(st.lists(st.integers(min_value=0, max_value=5), min_size=1, max_size=20))
+    def test_position_validation_in_bounds(self, shared_board, x, y):
+        """位置検証特性テスト（空ボードの盤内は必ず有効）"""
+        board = shared_board
+        piece = Tetromino(TetrominoType.I, x, y)
+        piece.rotation = 0
+        assert board.is_valid_position(piece), f"In-bounds ({x}, {y}) reported invalid"
+
+    @given(st.sampled_from(_TETROMINO_TYPES), st.integers(min_value=0, max_value=3))
+    @settings(max_examples=50)
+    def test_rotation_properties(self, tetromino_type, rotation):
+        """回転特性テスト
+
+        4回回転すると元に戻る特性。組み合わせは28通りしかないため
+        メモ化テーブル参照で再試行時のrotate呼び出しを省く。
+        """
+        assert _rotation_after_four(tetromino_type, rotation) == rotation, "Rotation not cyclic"
+
+    @given(st.lists(st.sampled_from(_ACTIONS), min_size=1, max_size=20))
     @settings(max_examples=30)
-    def test_reward_accumulation_properties(self, action_sequence):
+    def test_reward_accumulation_properties(self, shared_env, action_sequence):
         """報酬累積特性テスト"""
-        env = TetrisEnv()
-        try:
-            observation, info = env.reset()
-            
-            total_reward = 0
-            rewards = []
-            
-            for action in action_sequence:
-                obs, reward, terminated, truncated, info = env.step(action)
-                rewards.append(reward)
-                total_reward += reward
-                
-                if terminated:
-                    break
-            
-            # 報酬特性の確認
-            assert isinstance(total_reward, (int, float)), "Total reward not numeric"
-            assert all(isinstance(r, (int, float)) for r in rewards), "Individual rewards not numeric"
-            
-            # ソフトドロップ報酬は正であるべき
-            soft_drop_actions = [i for i, action in enumerate(action_sequence) 
-                               if action == Action.SOFT_DROP and i < len(rewards)]
-            for i in soft_drop_actions:
-                if rewards[i] > 0:  # ソフトドロップが実際に実行された場合
-                    pass  # 報酬が正であることを期待するが、移動不可の場合は0の場合もある
-            
-        finally:
-            env.close()
+        env = shared_env
+        observation, info = env.reset()
+
+        # appendの再確保を避けるため長さ既知のバッファへ直接書き込む
+        n = len(action_sequence)
+        rewards = np.empty(n, dtype=np.float64)
+        recorded = 0
+
+        for action in action_sequence:
+            obs, reward, terminated, truncated, info = env.step(action)
+            rewards[recorded] = reward
+            recorded += 1
+
+            if terminated:
+                break
+
+        # 報酬特性の確認
+        total_reward = rewards[:recorded].sum()
+        assert isinstance(total_reward, (int, float, np.floating)), "Total reward not numeric"
+        # バッファが数値dtypeであれば全要素が数値であることは自明
+        assert rewards.dtype.kind in "fi", "Individual rewards not numeric"
+
+        # ソフトドロップ報酬は正であるべき
+        soft_drop_actions = [i for i, action in enumerate(action_sequence)
+                             if action == Action.SOFT_DROP and i < recorded]
+        for i in soft_drop_actions:
+            if rewards[i] > 0:  # ソフトドロップが実際に実行された場合
+                pass  # 報酬が正であることを期待するが、移動不可の場合は0の場合もある
 
     @given(st.integers(min_value=1, max_value=100))
     @settings(max_examples=20)
-    def test_deterministic_behavior(self, seed):
+    def test_deterministic_behavior(self, shared_env_pair, seed):
         """決定論的動作テスト"""
-        env1 = TetrisEnv()
-        env2 = TetrisEnv()
-        
-        try:
-            # 同じシードで初期化
-            obs1, info1 = env1.reset(seed=seed)
-            obs2, info2 = env2.reset(seed=seed)
-            
-            # 同じアクションシーケンスを実行
-            action_sequence = [1, 2, 3, 4, 0, 5] * 5
-            
-            for action in action_sequence:
-                obs1, reward1, term1, trunc1, info1 = env1.step(action)
-                obs2, reward2, term2, trunc2, info2 = env2.step(action)
-                
-                # 同じ結果であることを確認
-                assert obs1["score"] == obs2["score"], f"Score mismatch: {obs1['score']} != {obs2['score']}"
-                assert reward1 == reward2, f"Reward mismatch: {reward1} != {reward2}"
-                assert term1 == term2, f"Termination mismatch: {term1} != {term2}"
-                
-                if term1:
-                    break
-            
-        finally:
-            env1.close()
-            env2.close()
+        env1, env2 = shared_env_pair
+
+        # 同じシードで初期化
+        obs1, info1 = env1.reset(seed=seed)
+        obs2, info2 = env2.reset(seed=seed)
+
+        # 同じアクションシーケンスを実行
+        action_sequence = [1, 2, 3, 4, 0, 5] * 5
 
-    @given(st.integers(min_value=0, max_value=5))
+        for action in action_sequence:
+            obs1, reward1, term1, trunc1, info1 = env1.step(action)
+            obs2, reward2, term2, trunc2, info2 = env2.step(action)
+
+            # 同じ結果であることを確認
+            assert obs1["score"] == obs2["score"], f"Score mismatch: {obs1['score']} != {obs2['score']}"
+            assert reward1 == reward2, f"Reward mismatch: {reward1} != {reward2}"
+            assert term1 == term2, f"Termination mismatch: {term1} != {term2}"
+
+            if term1:
+                break
+
+    @given(st.sampled_from(_ACTIONS))
     @settings(max_examples=50)
-    def test_observation_space_consistency(self, action):
+    def test_observation_space_consistency(self, shared_env, obs_schema, action):
         """観測空間一貫性テスト"""
-        env = TetrisEnv()
-        try:
-            observation, info = env.reset()
-            
-            # 観測空間の構造を記録
-            initial_keys = set(observation.keys())
-            initial_types = {k: type(v) for k, v in observation.items()}
-            initial_shapes = {k: v.shape if hasattr(v, 'shape') else None 
-                             for k, v in observation.items()}
-            
-            # アクション実行後も同じ構造を維持
-            obs, reward, terminated, truncated, info = env.step(action)
-            
-            assert set(obs.keys()) == initial_keys, "Observation keys changed"
-            
-            for key in initial_keys:
-                assert type(obs[key]) == initial_types[key], f"Type changed for key {key}"
-                if initial_shapes[key] is not None:
-                    assert obs[key].shape == initial_shapes[key], f"Shape changed for key {key}"
-            
-        finally:
-            env.close()
+        env = shared_env
+        env.reset()
+
+        # 観測空間の構造はクラススコープで一度だけ採取済み
+        initial_keys, initial_types, initial_shapes = obs_schema
+
+        # アクション実行後も同じ構造を維持
+        obs, reward, terminated, truncated, info = env.step(action)
+
+        assert set(obs.keys()) == initial_keys, "Observation keys changed"
+
+        for key in initial_keys:
+            assert type(obs[key]) == initial_types[key], f"Type changed for key {key}"
+            if initial_shapes[key] is not None:
+                assert obs[key].shape == initial_shapes[key], f"Shape changed for key {key}"
 
 
 class TestGameLogicProperties:
     """ゲームロジック特性テスト"""
 
-    @given(st.integers(min_value=0, max_value=1000))
-    @settings(max_examples=30)
+    @pytest.mark.parametrize("steps", [0, 10, 50, 100])
     def test_score_monotonicity(self, steps):
-        """スコア単調性テスト"""
+        """スコア単調性テスト
+
+        実効入力域は[0,100]しかないためHypothesisを使わず
+        代表値の明示的パラメトライズで決定論的に検証する。
+        """
         env = TetrisEnv()
         try:
             observation, info = env.reset()
-            previous_score = observation["score"]
-            
-            for i in range(min(steps, 100)):  # 最大100ステップに制限
+            max_steps = steps
+            score_history = np.empty(max_steps + 1, dtype=np.int64)
+            score_history[0] = observation["score"]
+            recorded = 1
+
+            for i in range(max_steps):
                 action = i % 6
                 obs, reward, terminated, truncated, info = env.step(action)
-                
-                # スコアは減少しない
-                assert obs["score"] >= previous_score, f"Score decreased: {obs['score']} < {previous_score}"
-                previous_score = obs["score"]
-                
+                score_history[recorded] = obs["score"]
+                recorded += 1
+
                 if terminated:
                     break
-            
+
+            # スコアは減少しない（ループ後にnp.diffで一括検証）
+            assert (np.diff(score_history[:recorded]) >= 0).all(), "Score decreased"
+
         finally:
             env.close()
 
@@ -301,13 +350,13 @@ class TestGameLogicProperties:
     def test_level_progression_properties(self, target_lines):
         """レベル進行特性テスト"""
         board = TetrisBoard()
-        
+
         initial_level = board.level
         board.lines_cleared = target_lines
         # レベル計算は自動的に行われる
         calculated_level = board.lines_cleared // 10 + 1
         board.level = calculated_level
-        
+
         # レベルは適切に更新される
         expected_level = max(1, 1 + target_lines // 10)
         assert board.level == expected_level, f"Level calculation error: {board.level} != {expected_level}"
@@ -317,19 +366,18 @@ class TestGameLogicProperties:
     def test_line_clear_detection(self, row_pattern):
         """ライン消去検出テスト"""
         board = TetrisBoard()
-        
-        # 最下段を指定パターンで埋める
+
+        # 最下段を指定パターンで埋める（行単位のベクトル代入）
         bottom_row = board.height - 1
-        for x, value in enumerate(row_pattern):
-            board.board[bottom_row][x] = 1 if value > 5 else 0
-        
+        board.board[bottom_row] = (np.asarray(row_pattern) > 5).astype(board.board.dtype)
+
         # 完全に埋まった行の場合のみライン消去が発生すべき
-        is_complete_line = all(board.board[bottom_row][x] != 0 for x in range(board.width))
-        
+        is_complete_line = bool((board.board[bottom_row] != 0).all())
+
         initial_lines_cleared = board.lines_cleared
         board._clear_lines()
-        
+
         if is_complete_line:
             assert board.lines_cleared > initial_lines_cleared, "Complete line not cleared"
         else:
-            assert board.lines_cleared == initial_lines_cleared, "Incomplete line was cleared"
\ No newline at end of file
+            assert board.lines_cleared == initial_lines_cleared, "Incomplete line was cleared"
@@ -3,6 +3,16 @@ from tetris.renderer import CUIRenderer
 from tetris.core import TetrisBoard
 
 
+@pytest.fixture(autouse=True)
+def _reset_last_render(cui_renderer):
+    """共有レンダラのlast_renderを各テスト前に初期化する
+
+    cui_rendererはセッション共有のため、前のテストが残した
+    last_renderが更新最適化テストの前提を崩さないようにする。
+    """
+    cui_renderer.last_render = ""
+
+
 class TestCUIRenderer:
     """CUIRendererクラスのテスト"""
 
@@ -15,12 +25,10 @@ class TestCUIRenderer:
         assert hasattr(cui_renderer, 'render_game_over')
         assert hasattr(cui_renderer, 'use_color')
 
-    def test_board_rendering(self, cui_renderer, tetris_board):
+    def test_board_rendering(self, cui_renderer, spawned_board):
         """ボード描画テスト"""
-        tetris_board.spawn_piece()
-        
         try:
-            result = cui_renderer.render_board(tetris_board)
+            result = cui_renderer.render_board(spawned_board)
             assert isinstance(result, str)
             assert len(result) > 0
             assert "QoderTetris" in result
@@ -52,10 +60,9 @@ class TestCUIRenderer:
         except Exception as e:
             pytest.fail(f"Game over screen rendering failed: {e}")
 
-    def test_render_method_with_states(self, cui_renderer, tetris_board):
+    def test_render_method_with_states(self, cui_renderer, spawned_board):
         """状態別renderメソッドテスト"""
-        tetris_board.spawn_piece()
-        
+        tetris_board = spawned_board
         try:
             # playing状態のレンダリング
             result = cui_renderer.render(tetris_board, "playing")
@@ -114,26 +121,21 @@ class TestCUIRenderer:
         except Exception as e:
             pytest.fail(f"Display management failed: {e}")
 
-    def test_color_functionality(self):
+    @pytest.mark.parametrize("use_color", [True, False])
+    def test_color_functionality(self, use_color):
         """色機能テスト"""
-        # 色ありレンダラー
-        color_renderer = CUIRenderer(use_color=True)
-        assert color_renderer.use_color == True
-        
-        # 色なしレンダラー
-        no_color_renderer = CUIRenderer(use_color=False)
-        assert no_color_renderer.use_color == False
-        
+        renderer = CUIRenderer(use_color=use_color)
+        assert renderer.use_color is use_color
+
         # 色設定の確認
-        assert hasattr(color_renderer, 'PIECE_COLORS')
-        assert hasattr(color_renderer, 'RESET_COLOR')
+        assert hasattr(renderer, 'PIECE_COLORS')
+        assert hasattr(renderer, 'RESET_COLOR')
 
-    def test_board_with_next_piece(self, cui_renderer, tetris_board):
+    def test_board_with_next_piece(self, cui_renderer, spawned_board):
         """次のピース表示テスト"""
-        tetris_board.spawn_piece()  # current_pieceとnext_pieceを生成
-        
+        # spawned_boardはcurrent_pieceとnext_pieceを生成済み
         try:
-            result = cui_renderer.render_board(tetris_board)
+            result = cui_renderer.render_board(spawned_board)
             assert isinstance(result, str)
             assert "Next:" in result
             
@@ -3,9 +3,31 @@
 """
 
 import numpy as np
+import platform
+import random
+from collections import deque
 from typing import List, Tuple, Optional
 from enum import IntEnum
-import copy
+
+# PyPyでは小さな配列に対するNumPy呼び出しのオーバーヘッドが支配的になる
+# ため、ホットパスは純Python（JITトレース可能）の実装に切り替える
+IS_PYPY = platform.python_implementation() == 'PyPy'
+
+# Numbaは任意依存（未導入でも純Pythonで動作する）
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Numba未導入時のダミーデコレータ"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
 
 class Action(IntEnum):
     """アクション定義"""
@@ -72,74 +94,278 @@ TETROMINO_SHAPES = {
     ]
 }
 
+@njit(cache=True, nogil=True)
+def _kernel_is_valid_masks(rows, piece_masks, px, py, height, full_mask):
+    """ビットマスク衝突判定カーネル
+
+    rows: 各行の占有ビットマスク（ビットx = 列xが埋まっている）
+    piece_masks: ピース形状の4行分の行マスク（x=0基準）
+    """
+    for r in range(4):
+        m = piece_masks[r]
+        if m == 0:
+            continue
+
+        y = py + r
+
+        # 横方向のシフトと壁チェック
+        if px >= 0:
+            shifted = m << px
+        else:
+            # 左壁からはみ出すビットがあれば無効
+            if m & ((1 << (-px)) - 1):
+                return False
+            shifted = m >> (-px)
+
+        if shifted & ~full_mask:
+            return False
+
+        # 床チェック
+        if y >= height:
+            return False
+
+        # 上端は除外（スポーン時）
+        if y < 0:
+            continue
+
+        # 既存ブロックとの衝突チェック
+        if shifted & rows[y]:
+            return False
+
+    return True
+
+
+@njit(cache=True, nogil=True)
+def _kernel_place(board, shape, px, py, color, width, height):
+    """ピース固定カーネル（ボードへの書き込み）"""
+    for dy in range(4):
+        for dx in range(4):
+            if shape[dy, dx] != 0:
+                nx = px + dx
+                ny = py + dy
+                if 0 <= ny < height and 0 <= nx < width:
+                    board[ny, nx] = color
+
+
+def _warmup_kernels():
+    """JITコンパイルコストを起動時に前払いする"""
+    dummy_board = np.zeros((4, 4), dtype=np.uint8)
+    dummy_shape = np.zeros((4, 4), dtype=np.int8)
+    dummy_rows = np.zeros(4, dtype=np.int64)
+    dummy_masks = np.zeros(4, dtype=np.int64)
+    _kernel_is_valid_masks(dummy_rows, dummy_masks, 0, 0, 4, 15)
+    _kernel_place(dummy_board, dummy_shape, 0, 0, 1, 4, 4)
+
+
+if HAS_NUMBA:
+    _warmup_kernels()
+
+
+def _rotate_90(shape: np.ndarray) -> np.ndarray:
+    """90度時計回りに回転"""
+    return np.ascontiguousarray(np.rot90(shape, k=-1))
+
+
+def _build_shapes() -> dict:
+    """全7ピース×4回転の形状テーブルをインポート時に構築"""
+    shapes = {}
+    for piece_type in TetrominoType:
+        base = np.array(TETROMINO_SHAPES[piece_type][0], dtype=np.int8)
+
+        # Oピースは回転しない
+        if piece_type == TetrominoType.O:
+            rotations = [base] * 4
+        else:
+            rotations = [base]
+            current = base
+            for _ in range(3):
+                current = _rotate_90(current)
+                rotations.append(current)
+
+        for rotation, arr in enumerate(rotations):
+            arr.setflags(write=False)  # 共有テーブルのため書き込み禁止
+            shapes[(piece_type, rotation)] = arr
+    return shapes
+
+
+# 全回転パターンの形状テーブル（インスタンス毎の再計算を排除）
+SHAPES = _build_shapes()
+
+
 class Tetromino:
-    """テトリミノクラス"""
-    
+    """テトリミノクラス
+
+    move()/rotate()のたびに新しいインスタンスを生成するため、
+    __slots__で__dict__を排除してメモリと属性アクセスを軽量化している。
+    （rotation等は外部から代入されるため、イミュータブル化はしない）
+    """
+
+    __slots__ = ('type', 'x', 'y', 'rotation')
+
     def __init__(self, tetromino_type: TetrominoType, x: int = 3, y: int = 0):
         self.type = tetromino_type
         self.x = x
         self.y = y
         self.rotation = 0
-        self.shapes = self._generate_rotations()
-    
-    def _generate_rotations(self) -> List[List[List[int]]]:
-        """回転パターンを生成"""
-        base_shape = TETROMINO_SHAPES[self.type][0]
-        rotations = [base_shape]
-        
-        # Oピースは回転しない
-        if self.type == TetrominoType.O:
-            return rotations * 4
-        
-        # 他のピースは90度ずつ回転
-        current = base_shape
-        for _ in range(3):
-            current = self._rotate_90(current)
-            rotations.append(current)
-        
-        return rotations
-    
-    def _rotate_90(self, shape: List[List[int]]) -> List[List[int]]:
-        """90度時計回りに回転"""
-        return [[shape[3-j][i] for j in range(4)] for i in range(4)]
-    
+
+    def reset(self, tetromino_type: TetrominoType, x: int = 3, y: int = 0):
+        """同一インスタンスを新しいピースとして再初期化する（プール再利用用）"""
+        self.type = tetromino_type
+        self.x = x
+        self.y = y
+        self.rotation = 0
+
     @property
-    def shape(self) -> List[List[int]]:
-        """現在の回転状態の形状を取得"""
-        return self.shapes[self.rotation % 4]
+    def shape(self) -> np.ndarray:
+        """現在の回転状態の形状を取得（共有テーブル参照）"""
+        return SHAPES[(self.type, self.rotation % 4)]
     
     def rotate(self) -> 'Tetromino':
-        """回転した新しいテトリミノを返す"""
-        new_tetromino = copy.deepcopy(self)
+        """回転した新しいテトリミノを返す
+
+        フィールドはスカラ4つだけなのでdeepcopyせず直接構築する。
+        """
+        new_tetromino = Tetromino(self.type, self.x, self.y)
         new_tetromino.rotation = (self.rotation + 1) % 4
         return new_tetromino
     
     def move(self, dx: int, dy: int) -> 'Tetromino':
         """移動した新しいテトリミノを返す"""
-        new_tetromino = copy.deepcopy(self)
-        new_tetromino.x += dx
-        new_tetromino.y += dy
+        new_tetromino = Tetromino(self.type, self.x + dx, self.y + dy)
+        new_tetromino.rotation = self.rotation
         return new_tetromino
 
+def _build_piece_row_masks() -> dict:
+    """全ピース×回転の行ビットマスクテーブルを構築（x=0基準）"""
+    masks = {}
+    for piece_type in TetrominoType:
+        for rotation in range(4):
+            shape = SHAPES[(piece_type, rotation)]
+            row_masks = np.zeros(4, dtype=np.int64)
+            for dy in range(4):
+                mask = 0
+                for dx in range(4):
+                    if shape[dy][dx] != 0:
+                        mask |= 1 << dx
+                row_masks[dy] = mask
+            masks[(piece_type, rotation)] = row_masks
+    return masks
+
+
+# ピース形状の行ビットマスク（衝突判定用）
+PIECE_ROW_MASKS = _build_piece_row_masks()
+
+# 純Pythonパス用の同テーブル（NumPyスカラを介さないPython intのタプル）
+PIECE_ROW_MASKS_PY = {
+    key: tuple(int(m) for m in masks)
+    for key, masks in PIECE_ROW_MASKS.items()
+}
+
+
+def _build_piece_extents() -> dict:
+    """全ピース×回転の占有セル範囲 (min_x, max_x, min_y, max_y) を構築"""
+    extents = {}
+    for piece_type in TetrominoType:
+        for rotation in range(4):
+            ys, xs = np.nonzero(SHAPES[(piece_type, rotation)])
+            extents[(piece_type, rotation)] = (
+                int(xs.min()), int(xs.max()), int(ys.min()), int(ys.max())
+            )
+    return extents
+
+
+# ピース形状のバウンディングボックス（境界の早期判定用）
+PIECE_EXTENTS = _build_piece_extents()
+
+
+def _build_piece_cells() -> dict:
+    """全ピース×回転の占有セル相対座標 (dy配列, dx配列) を構築"""
+    cells = {}
+    for piece_type in TetrominoType:
+        for rotation in range(4):
+            ys, xs = np.nonzero(SHAPES[(piece_type, rotation)])
+            cells[(piece_type, rotation)] = (ys, xs)
+    return cells
+
+
+# ピース形状の占有セルインデックス（描画スタンプ用）
+PIECE_CELLS = _build_piece_cells()
+
+
+def _build_piece_col_bottoms() -> dict:
+    """全ピース×回転の占有列ごとの最下段セル (dx, bottom_dy) を構築
+
+    テトリミノは任意の回転で列方向に連続なので、ハードドロップの
+    落下距離は各占有列の最下段セルだけで正確に決まる。
+    """
+    col_bottoms = {}
+    for piece_type in TetrominoType:
+        for rotation in range(4):
+            shape = SHAPES[(piece_type, rotation)]
+            bottoms = []
+            for dx in range(4):
+                ys = np.nonzero(shape[:, dx])[0]
+                if ys.size:
+                    bottoms.append((dx, int(ys.max())))
+            col_bottoms[(piece_type, rotation)] = tuple(bottoms)
+    return col_bottoms
+
+
+# ピース形状の列ごとの最下段セル（ハードドロップ距離計算用）
+PIECE_COL_BOTTOMS = _build_piece_col_bottoms()
+
+
 class TetrisBoard:
     """テトリスボードクラス"""
-    
-    def __init__(self, width: int = 10, height: int = 20):
+
+    def __init__(self, width: int = 10, height: int = 20, seed: Optional[int] = None):
         self.width = width
         self.height = height
-        self.board = np.zeros((height, width), dtype=int)
+        # セル値は0-7なのでuint8の連続配列で保持する
+        # （int64比でキャッシュ効率が良く、要素代入時のボクシングも軽い）
+        self.board = np.zeros((height, width), dtype=np.uint8)
+        # 7種1巡のバッグ方式乱数（決定論的リプレイ用に専用RNGを持つ）
+        self._rng = random.Random(seed)
+        self._bag = deque()
+        # 行マスク計算用の係数（列xのビット値）と全列埋まりマスク
+        self._pow2 = 1 << np.arange(width, dtype=np.int64)
+        self._full_mask = (1 << width) - 1
+        # 行占有ビットマスクのキャッシュ（衝突判定のホットパス用）。
+        # ボードが変わる箇所（reset/spawn/place/ライン消去）で再同期する
+        self._rows = np.zeros(height, dtype=np.int64)
+        # 列サマリ計算用の行インデックス（get_heights/get_holes向け）
+        self._row_indices = np.arange(height)[:, None]
+        # 描画用スクラッチバッファ（フレーム毎の確保を避ける）
+        self._render_buf = np.empty_like(self.board)
+        # アクション値→ハンドラのディスパッチテーブル（Action定義順）
+        self._action_table = (
+            self._do_nothing,
+            self._do_move_left,
+            self._do_move_right,
+            self._do_rotate,
+            self._do_soft_drop,
+            self._do_hard_drop,
+        )
         self.current_piece: Optional[Tetromino] = None
         self.next_piece: Optional[Tetromino] = None
+        # 固定済みピースの使い回し用（定常状態でスポーンの確保をゼロにする）
+        self._spare_piece: Optional[Tetromino] = None
         self.score = 0
         self.lines_cleared = 0
         self.level = 1
         self.game_over = False
         
-    def reset(self):
+    def reset(self, seed: Optional[int] = None):
         """ボードをリセット"""
-        self.board = np.zeros((self.height, self.width), dtype=int)
+        # 既存バッファをゼロ埋めして再利用（リセット毎の再確保なし）
+        self.board.fill(0)
+        self._rows.fill(0)
+        if seed is not None:
+            self._rng.seed(seed)
+        self._bag.clear()
         self.current_piece = None
         self.next_piece = None
+        self._spare_piece = None
         self.score = 0
         self.lines_cleared = 0
         self.level = 1
@@ -147,6 +373,10 @@ class TetrisBoard:
     
     def spawn_piece(self) -> bool:
         """新しいピースを生成"""
+        # ピース寿命の先頭で行マスクを再同期する。テストなどが
+        # boardへ直接書き込んでも次のスポーンから判定に反映される
+        self._rows = self._occupancy_rows()
+
         if self.next_piece is None:
             self.next_piece = self._random_piece()
         
@@ -161,64 +391,123 @@ class TetrisBoard:
         return True
     
     def _random_piece(self) -> Tetromino:
-        """ランダムなテトリミノを生成"""
-        piece_type = np.random.choice(list(TetrominoType))
-        return Tetromino(piece_type)
+        """ランダムなテトリミノを生成（7種1巡のバッグ方式）
+
+        固定済みピースのインスタンスが残っていればreset()で再利用し、
+        定常状態でのスポーン毎の確保をなくす。
+        """
+        if not self._bag:
+            picks = list(TetrominoType)
+            self._rng.shuffle(picks)
+            self._bag.extend(picks)
+
+        spare = self._spare_piece
+        if spare is not None:
+            self._spare_piece = None
+            spare.reset(self._bag.popleft())
+            return spare
+        return Tetromino(self._bag.popleft())
     
+    def _occupancy_rows(self) -> np.ndarray:
+        """各行の占有状態をビットマスク配列として再計算して取得"""
+        return (self.board != 0).astype(np.int64) @ self._pow2
+
     def is_valid_position(self, tetromino: Tetromino) -> bool:
         """テトリミノの位置が有効かチェック"""
-        shape = tetromino.shape
-        
-        for dy in range(4):
-            for dx in range(4):
-                if shape[dy][dx] != 0:
-                    nx, ny = tetromino.x + dx, tetromino.y + dy
-                    
-                    # 境界チェック
-                    if nx < 0 or nx >= self.width or ny >= self.height:
-                        return False
-                    
-                    # 上端は除外（スポーン時）
-                    if ny < 0:
-                        continue
-                        
-                    # 既存ブロックとの衝突チェック
-                    if self.board[ny][nx] != 0:
-                        return False
-        
+        key = (tetromino.type, tetromino.rotation % 4)
+
+        # バウンディングボックスによる早期境界判定（壁・床）
+        min_x, max_x, _, max_y = PIECE_EXTENTS[key]
+        if (tetromino.x + min_x < 0 or
+                tetromino.x + max_x >= self.width or
+                tetromino.y + max_y >= self.height):
+            return False
+
+        # Numba不在時（PyPy含む）はNumPyを介さない純Pythonパスを使う
+        if IS_PYPY or not HAS_NUMBA:
+            return self._is_valid_position_py(tetromino, key)
+
+        piece_masks = PIECE_ROW_MASKS[key]
+        return bool(_kernel_is_valid_masks(
+            self._rows, piece_masks,
+            tetromino.x, tetromino.y,
+            self.height, self._full_mask
+        ))
+
+    def _is_valid_position_py(self, tetromino: Tetromino, key: tuple) -> bool:
+        """衝突判定の純Python実装（インタプリタ／PyPy向け）
+
+        境界は呼び出し元のバウンディングボックス判定で除外済みのため、
+        重なる最大4行分の占有マスクだけをPython intで組み立てて比較する。
+        """
+        piece_masks = PIECE_ROW_MASKS_PY[key]
+        rows = self._rows
+        px = tetromino.x
+        py = tetromino.y
+        height = self.height
+
+        for r in range(4):
+            m = piece_masks[r]
+            if not m:
+                continue
+
+            y = py + r
+            if y < 0:
+                continue  # 上端は除外（スポーン時）
+            if y >= height:
+                return False
+
+            shifted = m << px if px >= 0 else m >> -px
+
+            if shifted & int(rows[y]):
+                return False
+
         return True
-    
+
     def place_piece(self, tetromino: Tetromino):
         """テトリミノをボードに固定"""
-        shape = tetromino.shape
-        
-        for dy in range(4):
-            for dx in range(4):
-                if shape[dy][dx] != 0:
-                    nx, ny = tetromino.x + dx, tetromino.y + dy
-                    if 0 <= ny < self.height and 0 <= nx < self.width:
-                        self.board[ny][nx] = tetromino.type
-        
-        # ライン消去チェック
+        if HAS_NUMBA:
+            _kernel_place(
+                self.board, tetromino.shape,
+                tetromino.x, tetromino.y,
+                int(tetromino.type),
+                self.width, self.height
+            )
+        else:
+            # Numba不在時は4x4のPythonループを避け、占有セルだけを
+            # ファンシーインデックスで一括書き込みする
+            dys, dxs = PIECE_CELLS[(tetromino.type, tetromino.rotation % 4)]
+            ys = tetromino.y + dys
+            xs = tetromino.x + dxs
+            valid = (ys >= 0) & (ys < self.height) & (xs >= 0) & (xs < self.width)
+            self.board[ys[valid], xs[valid]] = int(tetromino.type)
+
+        # 固定されたセルを行マスクへ反映してからライン消去チェック
+        self._rows = self._occupancy_rows()
         self._clear_lines()
-    
+
     def _clear_lines(self):
         """完成したラインを消去"""
-        lines_to_clear = []
-        
-        for y in range(self.height):
-            if np.all(self.board[y] != 0):
-                lines_to_clear.append(y)
-        
-        if lines_to_clear:
-            # 上から下へ順番に処理
-            for y in reversed(lines_to_clear):
-                # 該当行を削除し、上部に空行を追加
-                self.board = np.delete(self.board, y, axis=0)
-                self.board = np.insert(self.board, 0, np.zeros(self.width, dtype=int), axis=0)
-            
+        # 全列が埋まった行 = 行マスクが全ビット1
+        # （テストから直接呼ばれる場合に備えboardから再計算する）
+        self._rows = self._occupancy_rows()
+        full = self._rows == self._full_mask
+        cleared_count = int(full.sum())
+
+        if cleared_count:
+
+            # 消去行を除いた行を下詰めし、上部をゼロ埋めする。
+            # 既存バッファへ書き戻すことで盤面の再確保を避ける
+            kept = ~full
+            survivors = self.board[kept]
+            self.board[:cleared_count] = 0
+            self.board[cleared_count:] = survivors
+            # 行マスクも同じ下詰め操作で同期を保つ
+            surviving_rows = self._rows[kept]
+            self._rows[:cleared_count] = 0
+            self._rows[cleared_count:] = surviving_rows
+
             # スコア計算
-            cleared_count = len(lines_to_clear)
             self.lines_cleared += cleared_count
             line_scores = [0, 40, 100, 300, 1200]  # 0, 1, 2, 3, 4ライン
             score_multiplier = line_scores[min(cleared_count, 4)]
@@ -228,68 +517,176 @@ class TetrisBoard:
             self.level = self.lines_cleared // 10 + 1
     
     def apply_action(self, action: Action) -> Tuple[bool, int]:
-        """アクションを適用"""
+        """アクションを適用（アクション値でテーブル引きして分岐レス化）"""
         if self.game_over or self.current_piece is None:
             return False, 0
-        
-        reward = 0
-        moved = False
-        
-        if action == Action.MOVE_LEFT:
-            new_piece = self.current_piece.move(-1, 0)
-            if self.is_valid_position(new_piece):
-                self.current_piece = new_piece
-                moved = True
-        
-        elif action == Action.MOVE_RIGHT:
-            new_piece = self.current_piece.move(1, 0)
-            if self.is_valid_position(new_piece):
-                self.current_piece = new_piece
-                moved = True
-        
-        elif action == Action.ROTATE:
-            new_piece = self.current_piece.rotate()
-            if self.is_valid_position(new_piece):
-                self.current_piece = new_piece
-                moved = True
-        
-        elif action == Action.SOFT_DROP:
-            new_piece = self.current_piece.move(0, 1)
-            if self.is_valid_position(new_piece):
-                self.current_piece = new_piece
-                reward = 1  # ソフトドロップボーナス
-                moved = True
-        
-        elif action == Action.HARD_DROP:
-            # 一番下まで落とす
-            drop_distance = 0
-            while True:
-                new_piece = self.current_piece.move(0, drop_distance + 1)
-                if not self.is_valid_position(new_piece):
-                    break
-                drop_distance += 1
-            
-            if drop_distance > 0:
-                self.current_piece = self.current_piece.move(0, drop_distance)
-                reward = drop_distance * 2  # ハードドロップボーナス
-                moved = True
-        
-        return moved, reward
+
+        return self._action_table[action]()
+
+    def _do_nothing(self) -> Tuple[bool, int]:
+        """NOTHING: 何もしない"""
+        return False, 0
+
+    def _try_shift(self, dx: int, dy: int) -> bool:
+        """現在ピースを仮移動し、無効なら元に戻す（確保ゼロの試行）"""
+        piece = self.current_piece
+        piece.x += dx
+        piece.y += dy
+        if self.is_valid_position(piece):
+            return True
+        piece.x -= dx
+        piece.y -= dy
+        return False
+
+    def _do_move_left(self) -> Tuple[bool, int]:
+        """MOVE_LEFT: 左へ1マス移動"""
+        return self._try_shift(-1, 0), 0
+
+    def _do_move_right(self) -> Tuple[bool, int]:
+        """MOVE_RIGHT: 右へ1マス移動"""
+        return self._try_shift(1, 0), 0
+
+    def move_to_extreme(self, direction: int) -> int:
+        """現在のピースを左右どちらかの壁際まで一括で移動する
+
+        direction: -1で左端、+1で右端。
+        占有セル範囲から壁際の終端xを算出し、掃引する列範囲が
+        空いていれば1回で移動する（1マスずつのアクション適用を
+        O(1)に置き換える）。掃引範囲に既存ブロックがある場合は
+        1マスずつ詰め、1マス移動と同じ位置で止まる。
+
+        Returns:
+            移動後のx座標（ピースがない場合は-1）
+        """
+        piece = self.current_piece
+        if self.game_over or piece is None:
+            return -1
+
+        key = (piece.type, piece.rotation % 4)
+        min_x, max_x, _, _ = PIECE_EXTENTS[key]
+        target_x = -min_x if direction < 0 else self.width - 1 - max_x
+
+        # 現在位置から目標位置までに占有セルが通過する列範囲のマスク。
+        # 終端だけでなく経路全体を検証しないと、目標セルが空いている
+        # だけで途中の障害物をすり抜けてしまう
+        if direction < 0:
+            lo = target_x + min_x
+            hi = piece.x + max_x
+        else:
+            lo = piece.x + min_x
+            hi = target_x + max_x
+        sweep_mask = ((1 << (hi - lo + 1)) - 1) << lo
+
+        piece_masks = PIECE_ROW_MASKS_PY[key]
+        rows = self._rows
+        swept_clear = True
+        for r in range(4):
+            if not piece_masks[r]:
+                continue
+            y = piece.y + r
+            if y < 0:
+                continue  # 上端は除外（スポーン直後）
+            if int(rows[y]) & sweep_mask:
+                swept_clear = False
+                break
+
+        if swept_clear:
+            piece.x = target_x
+            return target_x
+
+        # 掃引範囲に既存ブロックがある場合のフォールバック
+        step = -1 if direction < 0 else 1
+        while self._try_shift(step, 0):
+            pass
+        return piece.x
+
+    def _do_rotate(self) -> Tuple[bool, int]:
+        """ROTATE: 時計回りに回転（仮回転して無効なら戻す）"""
+        piece = self.current_piece
+        old_rotation = piece.rotation
+        piece.rotation = (old_rotation + 1) % 4
+        if self.is_valid_position(piece):
+            return True, 0
+        piece.rotation = old_rotation
+        return False, 0
+
+    def _do_soft_drop(self) -> Tuple[bool, int]:
+        """SOFT_DROP: 1マス落下（ボーナス+1）"""
+        if self._try_shift(0, 1):
+            return True, 1  # ソフトドロップボーナス
+        return False, 0
+
+    def _do_hard_drop(self) -> Tuple[bool, int]:
+        """HARD_DROP: 一番下まで落とす（距離×2ボーナス）
+
+        1マスずつ衝突判定を繰り返す代わりに、占有列ごとに直下の
+        既存ブロックまでの距離を求めて最小値を取る（O(ピース幅)）。
+        """
+        piece = self.current_piece
+        key = (piece.type, piece.rotation % 4)
+        board = self.board
+
+        drop_distance = self.height
+        for dx, bottom_dy in PIECE_COL_BOTTOMS[key]:
+            x = piece.x + dx
+            y0 = piece.y + bottom_dy
+            start = max(y0 + 1, 0)
+
+            # 全盤面の一時ブール配列を作らず、対象列のスライスだけ走査する
+            hits = np.flatnonzero(board[start:, x])
+            if hits.size:
+                distance = start + int(hits[0]) - y0 - 1
+            else:
+                distance = self.height - y0 - 1
+
+            if distance < drop_distance:
+                drop_distance = distance
+
+        if drop_distance > 0:
+            # 落下距離は確定済みなので検証付きmove()を介さず直接更新する
+            piece.y += drop_distance
+            return True, drop_distance * 2  # ハードドロップボーナス
+        return False, 0
     
+    def fast_step(self, action: int, do_fall: bool) -> Tuple[int, bool]:
+        """env.step向けにアクション適用と自然落下を1呼び出しへ融合する
+
+        RLループの典型経路（アクション1つ→必要なら自然落下→報酬）を
+        中間タプルなしで処理し、スコア差分込みの報酬を返す。
+        apply_action/step は公開APIとしてそのまま残す。
+
+        Args:
+            action: 0〜5のアクション値
+            do_fall: このステップで自然落下を進めるか
+
+        Returns:
+            (reward, game_over)
+        """
+        prev_score = self.score
+        reward = 0
+        if not self.game_over and self.current_piece is not None:
+            _, reward = self._action_table[action]()
+            if do_fall:
+                # step()のロック処理をインライン化（ガードは上で済んでいる）
+                if not self._try_shift(0, 1):
+                    self.place_piece(self.current_piece)
+                    self._spare_piece = self.current_piece
+                    self.current_piece = None
+                    self.spawn_piece()
+        return reward + (self.score - prev_score), self.game_over
+
     def step(self) -> Tuple[bool, int]:
         """1ステップ進める（自然落下）"""
         if self.game_over or self.current_piece is None:
             return False, 0
         
-        # 自然落下を試行
-        new_piece = self.current_piece.move(0, 1)
-        
-        if self.is_valid_position(new_piece):
-            self.current_piece = new_piece
+        # 自然落下を試行（仮移動・失敗時は戻す）
+        if self._try_shift(0, 1):
             return True, 0
         else:
-            # 着地したのでピースを固定
+            # 着地したのでピースを固定（インスタンスはプールへ返す）
             self.place_piece(self.current_piece)
+            self._spare_piece = self.current_piece
             self.current_piece = None
             
             # 新しいピースをスポーン
@@ -299,20 +696,53 @@ class TetrisBoard:
             return True, 0
     
     def get_board_with_piece(self) -> np.ndarray:
-        """現在のピースを含むボード状態を取得"""
-        display_board = self.board.copy()
-        
-        if self.current_piece is not None:
-            shape = self.current_piece.shape
-            for dy in range(4):
-                for dx in range(4):
-                    if shape[dy][dx] != 0:
-                        nx, ny = self.current_piece.x + dx, self.current_piece.y + dy
-                        if 0 <= ny < self.height and 0 <= nx < self.width:
-                            display_board[ny][nx] = self.current_piece.type
-        
-        return display_board
+        """現在のピースを含むボード状態を取得
+
+        毎フレーム呼ばれるため、新規確保せずスクラッチバッファに
+        コピーして返す（返り値は次回呼び出しで上書きされる）。
+        """
+        if self._render_buf.shape != self.board.shape:
+            self._render_buf = np.empty_like(self.board)
+        np.copyto(self._render_buf, self.board)
+
+        piece = self.current_piece
+        if piece is not None:
+            if HAS_NUMBA:
+                # ウォームアップ済みの固定カーネルでスタンプ
+                # （ファンシーインデックスの一時配列生成を回避）
+                _kernel_place(
+                    self._render_buf,
+                    SHAPES[(piece.type, piece.rotation % 4)],
+                    piece.x, piece.y, int(piece.type),
+                    self.width, self.height,
+                )
+            else:
+                dys, dxs = PIECE_CELLS[(piece.type, piece.rotation % 4)]
+                ys = piece.y + dys
+                xs = piece.x + dxs
+                valid = (ys >= 0) & (ys < self.height) & (xs >= 0) & (xs < self.width)
+                self._render_buf[ys[valid], xs[valid]] = int(piece.type)
+
+        return self._render_buf
     
+    def get_heights(self) -> np.ndarray:
+        """各列の積み上がり高さ（床からのブロック最上段まで）を取得
+
+        RLの特徴量（合計高さ・凸凹など）向けのO(W)サマリ。盤面から
+        ベクトル演算で都度計算するため、boardへの直接書き込みとも
+        常に整合する。
+        """
+        occupied = self.board != 0
+        top = np.where(occupied.any(axis=0), occupied.argmax(axis=0), self.height)
+        return (self.height - top).astype(np.int16)
+
+    def get_holes(self) -> np.ndarray:
+        """各列の穴（最上段ブロックより下にある空セル）数を取得"""
+        occupied = self.board != 0
+        top = np.where(occupied.any(axis=0), occupied.argmax(axis=0), self.height)
+        below_top = self._row_indices > top
+        return (~occupied & below_top).sum(axis=0).astype(np.int16)
+
     def get_state(self) -> dict:
         """現在の状態を辞書形式で取得"""
         return {
@@ -56,7 +56,7 @@ class TetrisEnv(gym.Env):
         # 観測空間
         self.observation_space = spaces.Dict({
             'board': spaces.Box(
-                low=0, high=7, shape=(height, width), dtype=np.int32
+                low=0, high=7, shape=(height, width), dtype=np.uint8
             ),
             'current_piece_type': spaces.Discrete(8),  # 0-7 (0は空)
             'current_piece_x': spaces.Box(low=0, high=width-1, shape=(), dtype=np.int32),
@@ -74,16 +74,31 @@ class TetrisEnv(gym.Env):
         self.step_count = 0
         self.fall_time = 0
         self.fall_speed = 60  # フレーム数（レベルに応じて変更）
+
+        # ANSI描画用の事前計算（セル値→グリフと枠線・静的ブロック）
+        self._cell_glyphs = ("  ",) + ("██",) * 7
+        self._board_top = "┌" + "──" * width + "┐"
+        self._board_bottom = "└" + "──" * width + "┘"
+        self._controls_block = (
+            "\nControls:"
+            "\nA/D or ←/→: Move"
+            "\nW or ↑: Rotate"
+            "\nS or ↓: Soft Drop"
+            "\nSpace: Hard Drop"
+            "\nQ: Quit"
+        )
+        # 次ピースプレビューのグリフ行キャッシュ（type×rotationで高々28通り）
+        self._piece_preview: Dict = {}
         
     def reset(self, *, seed: Optional[int] = None, options: Optional[Dict] = None) -> Tuple[Dict, Dict]:
         """環境をリセット"""
         super().reset(seed=seed)
-        
-        if seed is not None:
-            np.random.seed(seed)
-        
-        # ボードリセット
-        self.board.reset()
+
+        # グローバルRNG（np.random.seed）には触れない。再シードは
+        # プロセス全体への副作用で、並列環境同士を同じ乱数列に
+        # 縛ってしまう。ボード専用Generatorにのみシードを渡す。
+        # ボードリセット（シードはバッグ乱数へ伝搬）
+        self.board.reset(seed=seed)
         self.board.spawn_piece()
         
         # 内部状態リセット
@@ -99,38 +114,30 @@ class TetrisEnv(gym.Env):
     
     def step(self, action: Union[int, Action]) -> Tuple[Dict, float, bool, bool, Dict]:
         """1ステップ実行"""
-        if isinstance(action, int):
-            action = Action(action)
+        # Action(...)のenum構築はステップ毎に積むと高コストなので、
+        # 範囲チェックだけ行い素のintのままディスパッチする
+        # （apply_actionはテーブル引きのためIntEnumでもintでも等価）
+        action = int(action)
+        if not 0 <= action < 6:
+            raise ValueError(f"Invalid action: {action}")
         
-        # 前のスコアを記録
-        prev_score = self.board.score
-        
-        # アクション実行
-        action_successful, action_reward = self.board.apply_action(action)
-        
-        # 自然落下処理
+        # 自然落下タイミングを判定してから、アクション適用＋落下＋
+        # スコア差分を1回のfast_step呼び出しへ融合する
         self.fall_time += 1
-        if self.fall_time >= self.fall_speed:
+        do_fall = self.fall_time >= self.fall_speed
+        if do_fall:
             self.fall_time = 0
-            self.board.step()
-        
+        reward, terminated = self.board.fast_step(action, do_fall)
+
         # レベル変更時の落下速度更新
         self._update_fall_speed()
-        
-        # 報酬計算
-        reward = action_reward
-        
-        # スコア増加による報酬
-        score_diff = self.board.score - prev_score
-        reward += score_diff
-        
+
         # ゲームオーバー時のペナルティ
-        if self.board.game_over:
+        if terminated:
             reward -= 100
-        
+
         # 観測・情報取得
         observation = self._get_observation()
-        terminated = self.board.game_over
         truncated = False  # 今回は時間制限なし
         info = self._get_info()
         
@@ -138,6 +145,107 @@ class TetrisEnv(gym.Env):
         
         return observation, reward, terminated, truncated, info
     
+    def step_inplace(self, action: Union[int, Action], out: Dict) -> Tuple[Dict, float, bool, bool]:
+        """step()と同じ遷移を実行し、観測を呼び出し側のバッファへ書き込む
+
+        ステップ毎の観測辞書・ボードコピーの生成を行わず、outの
+        'board'配列へnp.copytoし、スカラーキーを上書きする。
+        計測ループ（リークテスト・ベンチマーク）やアロケーションを
+        抑えたいRLループ向け。infoが必要な場合は通常のstep()を使う。
+
+        Args:
+            out: 'board'キーに(height, width)のndarrayを持つ辞書
+
+        Returns:
+            (out, reward, terminated, truncated)
+        """
+        action = int(action)
+        if not 0 <= action < 6:
+            raise ValueError(f"Invalid action: {action}")
+
+        board = self.board
+        self.fall_time += 1
+        do_fall = self.fall_time >= self.fall_speed
+        if do_fall:
+            self.fall_time = 0
+        reward, terminated = board.fast_step(action, do_fall)
+
+        self._update_fall_speed()
+
+        if terminated:
+            reward -= 100
+
+        # 観測をバッファへ直接書き込む
+        np.copyto(out['board'], board.board, casting='unsafe')
+        piece = board.current_piece
+        out['current_piece_type'] = piece.type if piece else 0
+        out['current_piece_x'] = piece.x if piece else 0
+        out['current_piece_y'] = piece.y if piece else 0
+        out['current_piece_rotation'] = piece.rotation if piece else 0
+        out['next_piece_type'] = board.next_piece.type if board.next_piece else 0
+        out['score'] = board.score
+        out['lines_cleared'] = board.lines_cleared
+        out['level'] = board.level
+
+        self.step_count += 1
+
+        return out, reward, board.game_over, False
+
+    def step_batch(
+        self,
+        actions,
+        out_obs: Optional[np.ndarray] = None,
+        out_reward: Optional[np.ndarray] = None,
+        out_done: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """複数アクションをまとめて実行するバッチAPI（RL学習用）
+
+        step()と同じ遷移を辿るが、ステップ毎の観測辞書の生成を行わず、
+        事前確保した配列（省略時は内部で確保）へ直接書き込む。
+        ゲームオーバーで打ち切り、実行済みステップ分のビューを返す。
+
+        Returns:
+            (obs_boards, rewards, dones):
+                obs_boards[i] はピース込みボード (height, width)
+        """
+        n = len(actions)
+        if out_obs is None:
+            out_obs = np.empty((n, self.height, self.width), dtype=np.int8)
+        if out_reward is None:
+            out_reward = np.empty(n, dtype=np.float32)
+        if out_done is None:
+            out_done = np.zeros(n, dtype=bool)
+
+        board = self.board
+        executed = 0
+
+        for i in range(n):
+            prev_score = board.score
+            _, action_reward = board.apply_action(int(actions[i]))
+
+            # 自然落下処理
+            self.fall_time += 1
+            if self.fall_time >= self.fall_speed:
+                self.fall_time = 0
+                board.step()
+
+            self._update_fall_speed()
+
+            reward = action_reward + (board.score - prev_score)
+            if board.game_over:
+                reward -= 100
+
+            out_obs[i] = board.get_board_with_piece()
+            out_reward[i] = reward
+            out_done[i] = board.game_over
+            self.step_count += 1
+            executed = i + 1
+
+            if board.game_over:
+                break
+
+        return out_obs[:executed], out_reward[:executed], out_done[:executed]
+
     def render(self):
         """レンダリング"""
         if self.render_mode == "ansi":
@@ -152,19 +260,26 @@ class TetrisEnv(gym.Env):
         pass
     
     def _get_observation(self) -> Dict:
-        """現在の観測を取得"""
-        state = self.board.get_state()
-        
+        """現在の観測を取得
+
+        get_state()経由だと余計なboard.copy()とピース込みボードの
+        合成が走るため、必要なフィールドだけ直接読む。astypeが
+        コピーを兼ねるのでboardのコピーは1回で済む。
+        """
+        board = self.board
+        piece = board.current_piece
+
         return {
-            'board': state['board'].astype(np.int32),
-            'current_piece_type': np.int32(state['current_piece_type']),
-            'current_piece_x': np.int32(state['current_piece_x']),
-            'current_piece_y': np.int32(state['current_piece_y']),
-            'current_piece_rotation': np.int32(state['current_piece_rotation']),
-            'next_piece_type': np.int32(state['next_piece_type']),
-            'score': np.int32(state['score']),
-            'lines_cleared': np.int32(state['lines_cleared']),
-            'level': np.int32(state['level']),
+            # 盤面はuint8のまま渡す（int32へ広げると観測コピーが4倍になる）
+            'board': board.board.copy(),
+            'current_piece_type': np.int32(piece.type if piece else 0),
+            'current_piece_x': np.int32(piece.x if piece else 0),
+            'current_piece_y': np.int32(piece.y if piece else 0),
+            'current_piece_rotation': np.int32(piece.rotation if piece else 0),
+            'next_piece_type': np.int32(board.next_piece.type if board.next_piece else 0),
+            'score': np.int32(board.score),
+            'lines_cleared': np.int32(board.lines_cleared),
+            'level': np.int32(board.level),
         }
     
     def _get_info(self) -> Dict:
@@ -194,57 +309,94 @@ class TetrisEnv(gym.Env):
         lines.append(f"Lines: {self.board.lines_cleared}")
         lines.append("")
         
-        # 次のピース表示
-        if self.board.next_piece:
+        # 次のピース表示（グリフ行はピース種×回転でメモ化）
+        glyphs = self._cell_glyphs
+        next_piece = self.board.next_piece
+        if next_piece:
+            key = (next_piece.type, next_piece.rotation % 4)
+            preview = self._piece_preview.get(key)
+            if preview is None:
+                preview = ["".join("██" if cell != 0 else "  " for cell in row)
+                           for row in next_piece.shape]
+                self._piece_preview[key] = preview
             lines.append("Next:")
-            next_shape = self.board.next_piece.shape
-            for row in next_shape:
-                line = ""
-                for cell in row:
-                    line += "██" if cell != 0 else "  "
-                lines.append(line)
+            lines.extend(preview)
         lines.append("")
-        
+
         # ボード表示
         board_with_piece = self.board.get_board_with_piece()
-        
+
         # 上端
-        lines.append("┌" + "──" * self.width + "┐")
-        
-        # ボード内容
-        for y in range(self.height):
-            line = "│"
-            for x in range(self.width):
-                cell = board_with_piece[y, x]
-                if cell == 0:
-                    line += "  "
-                else:
-                    # ピースタイプに応じた表示
-                    symbols = {1: "██", 2: "██", 3: "██", 4: "██", 5: "██", 6: "██", 7: "██"}
-                    line += symbols.get(cell, "██")
-            line += "│"
-            lines.append(line)
-        
+        lines.append(self._board_top)
+
+        # ボード内容（行ごとにグリフテーブルを引いて一括結合）
+        for row in board_with_piece.tolist():
+            lines.append("│" + "".join(glyphs[c] if 0 <= c <= 7 else "██" for c in row) + "│")
+
         # 下端
-        lines.append("└" + "──" * self.width + "┘")
+        lines.append(self._board_bottom)
         
         # ゲームオーバー表示
         if self.board.game_over:
             lines.append("")
             lines.append("GAME OVER")
         
-        # 操作説明
-        lines.append("")
-        lines.append("Controls:")
-        lines.append("A/D or ←/→: Move")
-        lines.append("W or ↑: Rotate") 
-        lines.append("S or ↓: Soft Drop")
-        lines.append("Space: Hard Drop")
-        lines.append("Q: Quit")
+        # 操作説明（静的ブロックを事前計算済み）
+        lines.append(self._controls_block)
         
         return "\n".join(lines)
 
 
+class BatchTetrisEnv:
+    """複数の独立した環境をまとめてステップするバッチ環境（RL学習用）
+
+    ゲーム状態はピース単位のオブジェクトで保持しているため盤面の
+    SIMD一括更新はできないが、step_inplace経由で観測辞書の生成を
+    省き、N環境分の観測を共有の(N, height, width)バッファへ直接
+    書き込むことでPythonオーバーヘッドを束ねる。
+    """
+
+    def __init__(self, num_envs: int, width: int = 10, height: int = 20):
+        self.num_envs = num_envs
+        self.envs = [TetrisEnv(width, height) for _ in range(num_envs)]
+        self._obs = np.empty((num_envs, height, width), dtype=np.uint8)
+        self._rewards = np.empty(num_envs, dtype=np.float32)
+        self._dones = np.zeros(num_envs, dtype=bool)
+        # 各環境のstep_inplace先（共有バッファの行ビュー）
+        self._obs_bufs = [{'board': self._obs[i]} for i in range(num_envs)]
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        """全環境をリセットし、(N, height, width)のボード観測を返す"""
+        for i, env in enumerate(self.envs):
+            env.reset(seed=None if seed is None else seed + i)
+            np.copyto(self._obs[i], env.board.board)
+        self._dones[:] = False
+        return self._obs
+
+    def step(self, actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """全環境を1ステップ進める
+
+        Args:
+            actions: 長さNのアクション列
+
+        Returns:
+            (obs, rewards, dones): 観測・報酬・終了フラグの共有バッファ。
+            終了した環境は自動的にリセットされる。
+        """
+        for i, env in enumerate(self.envs):
+            _, reward, terminated, _ = env.step_inplace(int(actions[i]), self._obs_bufs[i])
+            self._rewards[i] = reward
+            self._dones[i] = terminated
+            if terminated:
+                env.reset()
+        return self._obs, self._rewards, self._dones
+
+    def close(self):
+        """全環境をクリーンアップ"""
+        for env in self.envs:
+            env.close()
+
+
 # Gymnasiumへの登録
 gym.register(
     id='Tetris-v0',
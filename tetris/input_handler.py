@@ -5,7 +5,7 @@
 import sys
 import threading
 import time
-from queue import Queue, Empty
+from collections import deque
 from typing import Optional, Callable
 from .core import Action
 
@@ -45,7 +45,12 @@ class InputHandler:
     """キー入力を処理するクラス"""
     
     def __init__(self):
-        self.input_queue = Queue()
+        # 生産者・消費者が1対1なのでロック不要のdequeをリングバッファに
+        # 使う（append/popleftはGIL下でアトミック）。取りこぼし防止より
+        # 古い入力の破棄を優先するためmaxlenで上限を付ける
+        self._buf = deque(maxlen=64)
+        # ブロッキング待機用のシグナル（enqueue時にセット）
+        self._data_ready = threading.Event()
         self.running = False
         self.input_thread = None
         self.old_settings = None
@@ -127,7 +132,12 @@ class InputHandler:
                 char = get_char()
                 
                 if char is None:
-                    time.sleep(0.005)  # CPU使用率を下げる（5msに減らして応答性向上）
+                    # Unixではselectで入力到着までブロックし、アイドル時の
+                    # ポーリングCPUをほぼゼロにする（50msで起きて終了判定）
+                    if select is not None:
+                        select.select([sys.stdin], [], [], 0.05)
+                    else:
+                        time.sleep(0.005)
                     continue
                 
                 # Unix系での矢印キー処理
@@ -139,32 +149,53 @@ class InputHandler:
                     arrow_sequence += char
                     if len(arrow_sequence) >= 3:
                         # 矢印キーシーケンス完了
-                        self.input_queue.put(arrow_sequence)
+                        self._buf.append(arrow_sequence)
+                        self._data_ready.set()
                         arrow_sequence = ""
                     continue
                 
                 # 通常のキー処理
                 if char:
-                    self.input_queue.put(char)
+                    self._buf.append(char)
+                    self._data_ready.set()
                 
             except Exception as e:
                 # エラーが発生した場合はループを継続
                 time.sleep(0.01)
     
     def get_input(self) -> Optional[str]:
-        """キューから入力を取得し、アクションまたはコマンドを返す"""
-        try:
-            return self.input_queue.get_nowait()
-        except Empty:
-            return None
-    
+        """バッファから入力を取得し、アクションまたはコマンドを返す"""
+        buf = self._buf
+        if buf:
+            return buf.popleft()
+        # 空を見た後にclearし、クリア直前のenqueueを再確認して取りこぼしを防ぐ
+        self._data_ready.clear()
+        if buf:
+            return buf.popleft()
+        return None
+
+    def wait_for_key(self, timeout: float) -> Optional[str]:
+        """入力が来るまで最大timeout秒ブロックして取得
+
+        ポーリング＋sleepと異なり、待機中はCPUを消費せず、
+        入力があれば即座に返る。
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        buf = self._buf
+        while True:
+            if buf:
+                return buf.popleft()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            self._data_ready.clear()
+            if buf:
+                continue
+            self._data_ready.wait(remaining)
+
     def clear_input_buffer(self):
         """入力バッファをクリア"""
-        while True:
-            try:
-                self.input_queue.get_nowait()
-            except Empty:
-                break
+        self._buf.clear()
 
 
 class GameController:
@@ -174,7 +205,10 @@ class GameController:
         self.input_handler = InputHandler()
         self.last_action_time = 0
         self.action_delay = 0.1  # アクション間の最小間隔（100ms）- リピートを防ぐ
-        
+
+        # ブロッキング待機で取得した未処理キー
+        self._pending_key = None
+
         # キーリピートは無効化
         self.held_keys = {}
         self.key_repeat_times = {}
@@ -187,12 +221,29 @@ class GameController:
         """コントローラー停止"""
         self.input_handler.stop()
     
+    def wait_for_input(self, timeout: float) -> Optional[str]:
+        """入力があるまで最大timeout秒ブロックする（フレーム待機兼用）
+
+        取得したキーは保持され、次のget_action_or_command等で処理される。
+        """
+        if self._pending_key is None:
+            self._pending_key = self.input_handler.wait_for_key(timeout)
+        return self._pending_key
+
+    def _next_key(self) -> Optional[str]:
+        """保留中のキーを優先して入力を1つ取り出す"""
+        if self._pending_key is not None:
+            key = self._pending_key
+            self._pending_key = None
+            return key
+        return self.input_handler.get_input()
+
     def get_action_or_command(self) -> tuple:
         """入力を取得し、アクションまたはコマンドを返す（シンプルワンショット）"""
         current_time = time.time()
-        
+
         # 新しいキー入力をチェック
-        key = self.input_handler.get_input()
+        key = self._next_key()
         if key:
             # 制御コマンドかチェック
             command = self.input_handler.control_keys.get(key)
@@ -211,11 +262,11 @@ class GameController:
     
     def get_any_input(self) -> Optional[str]:
         """任意の入力を取得（スタート画面等で使用）"""
-        return self.input_handler.get_input()
-    
+        return self._next_key()
+
     def get_start_input(self) -> tuple:
         """スタート画面用の入力処理（シンプル）"""
-        key = self.input_handler.get_input()
+        key = self._next_key()
         if key:
             # 終了コマンドかチェック
             if key in ['q', 'Q']:
@@ -5,8 +5,34 @@ CUIベースのリアルタイム描画システム
 import os
 import sys
 from typing import Optional
+
+import numpy as np
+
 from .core import TetrisBoard, TetrominoType
 
+# フレーム毎に変化しない定型行はモジュール定数として1度だけ確保する
+# （60Hzループで同じリテラルから文字列を作り直さない）
+_TOP = "╔════════════════════════════════════╗"
+_TITLE = "║           QoderTetris              ║"
+_SEP = "╠════════════════════════════════════╣"
+_BOTTOM = "╚════════════════════════════════════╝"
+_EMPTY_ROW = "║                                    ║"
+_NEXT_HEADER = "║ Next:                              ║"
+_BOARD_TOP = "║ ┌────────────────────┐             ║"
+_BOARD_BOTTOM = "║ └────────────────────┘             ║"
+_GAME_OVER_ROWS = (
+    "║            GAME OVER               ║",
+    "║         Press R to Restart         ║",
+)
+_CONTROLS = (
+    "║ Controls:                          ║",
+    "║ A/D or ←/→: Move Left/Right        ║",
+    "║ W or ↑: Rotate                     ║",
+    "║ S or ↓: Soft Drop                  ║",
+    "║ Space: Hard Drop                   ║",
+    "║ R: Restart  Q: Quit                ║",
+)
+
 
 class CUIRenderer:
     """CUIベースのテトリス描画クラス"""
@@ -28,154 +54,318 @@ class CUIRenderer:
     def __init__(self, use_color: bool = True):
         self.use_color = use_color
         self.last_render = ""
+        # 部分再描画用の行分割キャッシュ。_last_lines_srcは分割元の
+        # 文字列そのもので、last_renderが外部から差し替えられた場合の
+        # 検出（is比較）に使う
+        self._last_lines: list = []
+        self._last_lines_src = ""
+        # 静的画面のキャッシュ（スタート画面は完全に固定文字列）
+        self._start_screen_cache = self._build_start_screen()
+        self._game_over_cache = None  # (score, level, lines) -> 描画結果
+        # フレーム毎のリスト確保を避けるスクラッチバッファ
+        self._lines: list = []
+        # 直前フレームのメモ（同一ボード状態の再描画は文字列再構築なし）
+        self._board_render_cache = None  # (key, 描画結果)
+        # スコア情報行のメモ。ピースが動くだけのフレームでは値が
+        # 変わらないため、整形済みの2行を値キーで使い回す
+        self._info_cache = None  # ((score, level, lines), (行1, 行2))
+
+        # セル値→グリフ／色のルックアップテーブル。
+        # _glyph_lutはobject配列なので行全体を1回のファンシーインデックス
+        # でグリフ列に変換でき、_color_lutはPIECE_COLORS.getのdict探索を
+        # C実装のリスト添字に置き換える。正常なセル値は0〜7だが、
+        # ボードはuint8なので256エントリ確保し、壊れた値でも
+        # IndexErrorにせず無色の██として劣化描画する
+        self._glyph_lut = np.array(["  "] + ["██"] * 255, dtype=object)
+        self._color_lut = [self.PIECE_COLORS.get(v, '') for v in range(256)]
+
+        # use_colorはインスタンス生成後に変わらないため、行レンダラを
+        # ここで1度だけ選択する（フレーム毎・セル毎の色分岐を排除）
+        if use_color:
+            self._append_board_rows = self._append_board_rows_color
+            self._append_next_rows = self._append_next_rows_color
+        else:
+            self._append_board_rows = self._append_board_rows_mono
+            self._append_next_rows = self._append_next_rows_mono
+
+        # バイト直書き用のstdoutファイルディスクリプタ
+        # （テキストラッパの encode + ロック取得を回避する）
+        try:
+            self._stdout_fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._stdout_fd = None
+        # fdが取れないストリーム（パイプラッパ等）向けの中間フォール
+        # バック。バイト層へ直接書けばテキストエンコーダを通さずに済む
+        self._stdout_buffer = getattr(sys.stdout, 'buffer', None)
+
+        # TTY判定とVT有効化は構築時に1度だけ済ませ、以後のカーソル
+        # 制御はフラグ参照だけで書くか書かないかを決める
+        try:
+            self._is_tty = sys.stdout.isatty()
+        except (AttributeError, ValueError):
+            self._is_tty = False
+        if self._is_tty:
+            self._enable_vt_mode()
     
     def clear_screen(self):
-        """画面をクリア"""
-        if os.name == 'nt':  # Windows
-            os.system('cls')
-        else:  # Unix/Linux/Mac
-            os.system('clear')
+        """画面をクリア（ANSIシーケンスの直接書き込み）
+
+        os.system('cls'/'clear')はクリアのたびにシェルをfork/exec
+        するため数十msかかる。ESC[2J+ESC[Hを直接書けば1回のwriteで
+        済む（Windowsは_enable_vt_modeでVT処理を有効化済みの前提）。
+        """
+        self._write_bytes(b'\033[2J\033[H')
+
+    def _write_bytes(self, payload: bytes):
+        """エスケープ列をできるだけ低い層へ1回で書き出す"""
+        if self._stdout_fd is not None:
+            sys.stdout.flush()
+            os.write(self._stdout_fd, payload)
+        elif self._stdout_buffer is not None:
+            self._stdout_buffer.write(payload)
+            self._stdout_buffer.flush()
+        else:
+            sys.stdout.write(payload.decode('ascii'))
+            sys.stdout.flush()
+
+    def _enable_vt_mode(self):
+        """WindowsコンソールでVTエスケープ処理を有効化する
+
+        Windows 10以降のconhostはSetConsoleModeで
+        ENABLE_VIRTUAL_TERMINAL_PROCESSINGを立てればANSIを解釈する。
+        失敗しても害はないため黙って続行する。
+        """
+        if os.name != 'nt':
+            return
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                # ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+                kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+        except Exception:
+            pass
     
     def move_cursor_to_top(self):
         """カーソルを画面上部に移動"""
         sys.stdout.write('\033[H')  # カーソルをホームポジションに
         sys.stdout.flush()
     
+    # PERF: このレンダラ群に@numba.jitを付けないこと。文字列構築と
+    # dict/list参照が支配的なためobject modeへ落ち、素のCPythonより
+    # 遅くなる（数値ホットパスはcore.pyの@njitカーネルに分離済み）。
     def render_board(self, board: TetrisBoard) -> str:
-        """ボードを文字列として描画"""
-        lines = []
-        
+        """ボードを文字列として描画（同一状態の連続描画はメモ化）"""
+        board_with_piece = board.get_board_with_piece()
+        cache_key = (
+            board_with_piece.tobytes(),
+            board.score,
+            board.level,
+            board.lines_cleared,
+            board.next_piece.type if board.next_piece else 0,
+            board.game_over,
+        )
+        if self._board_render_cache is not None and self._board_render_cache[0] == cache_key:
+            return self._board_render_cache[1]
+
+        # スクラッチバッファを再利用（clearは確保済み領域を保持する）
+        lines = self._lines
+        lines.clear()
+
         # タイトル
-        lines.append("╔════════════════════════════════════╗")
-        lines.append("║           QoderTetris              ║")
-        lines.append("╠════════════════════════════════════╣")
+        lines.append(_TOP)
+        lines.append(_TITLE)
+        lines.append(_SEP)
         
-        # ゲーム情報を横並びで表示
-        score_line = f"║ Score: {board.score:<8} Level: {board.level:<3} ║"
+        # ゲーム情報を横並びで表示（値が前フレームと同じなら再整形しない）
+        info_key = (board.score, board.level, board.lines_cleared)
+        if self._info_cache is not None and self._info_cache[0] == info_key:
+            score_line, lines_line = self._info_cache[1]
+        else:
+            score_line = f"║ Score: {board.score:<8} Level: {board.level:<3} ║"
+            lines_line = f"║ Lines: {board.lines_cleared:<8}            ║"
+            self._info_cache = (info_key, (score_line, lines_line))
         lines.append(score_line)
-        
-        lines_line = f"║ Lines: {board.lines_cleared:<8}            ║"
         lines.append(lines_line)
         
-        lines.append("╠════════════════════════════════════╣")
+        lines.append(_SEP)
         
         # 次のピース表示エリア
-        lines.append("║ Next:                              ║")
+        lines.append(_NEXT_HEADER)
         
         if board.next_piece:
-            next_shape = board.next_piece.shape
-            for i, row in enumerate(next_shape):
-                if i < 4:  # 最大4行表示
-                    line = "║ "
-                    for cell in row:
-                        if cell != 0 and self.use_color:
-                            color = self.PIECE_COLORS.get(board.next_piece.type, '')
-                            line += f"{color}██{self.RESET_COLOR}"
-                        elif cell != 0:
-                            line += "██"
-                        else:
-                            line += "  "
-                    # パディング調整
-                    line += " " * (32 - len(line.replace('\033[96m', '').replace('\033[0m', '').replace('\033[93m', '').replace('\033[95m', '').replace('\033[92m', '').replace('\033[91m', '').replace('\033[94m', '').replace('\033[33m', '')) + len("║ "))
-                    line += " ║"
-                    lines.append(line)
+            self._append_next_rows(board.next_piece, lines)
         
         # 空行で調整
         for _ in range(4 - (4 if board.next_piece else 0)):
-            lines.append("║                                    ║")
+            lines.append(_EMPTY_ROW)
         
-        lines.append("╠════════════════════════════════════╣")
+        lines.append(_SEP)
         
         # メインゲームボード
-        board_with_piece = board.get_board_with_piece()
-        
         # 上端
-        lines.append("║ ┌────────────────────┐             ║")
+        lines.append(_BOARD_TOP)
         
         # ボード内容（上位4行は非表示エリア）
-        for y in range(4, board.height):  # 上位4行をスキップ
-            line = "║ │"
-            for x in range(board.width):
-                cell = board_with_piece[y, x]
-                if cell == 0:
-                    line += "  "
-                else:
-                    if self.use_color:
-                        color = self.PIECE_COLORS.get(cell, '')
-                        line += f"{color}██{self.RESET_COLOR}"
-                    else:
-                        line += "██"
-            line += "│             ║"
-            lines.append(line)
+        self._append_board_rows(board_with_piece, lines)
         
         # 下端
-        lines.append("║ └────────────────────┘             ║")
+        lines.append(_BOARD_BOTTOM)
         
-        lines.append("╠════════════════════════════════════╣")
+        lines.append(_SEP)
         
         # ゲームオーバー表示
         if board.game_over:
-            lines.append("║            GAME OVER               ║")
-            lines.append("║         Press R to Restart         ║")
+            lines.extend(_GAME_OVER_ROWS)
         else:
-            lines.append("║                                    ║")
-            lines.append("║                                    ║")
+            lines.append(_EMPTY_ROW)
+            lines.append(_EMPTY_ROW)
         
-        lines.append("╠════════════════════════════════════╣")
+        lines.append(_SEP)
         
         # 操作説明
-        lines.append("║ Controls:                          ║")
-        lines.append("║ A/D or ←/→: Move Left/Right        ║")
-        lines.append("║ W or ↑: Rotate                     ║")
-        lines.append("║ S or ↓: Soft Drop                  ║")
-        lines.append("║ Space: Hard Drop                   ║")
-        lines.append("║ R: Restart  Q: Quit                ║")
-        lines.append("╚════════════════════════════════════╝")
-        
-        return "\n".join(lines)
-    
+        lines.extend(_CONTROLS)
+        lines.append(_BOTTOM)
+
+        rendered = "\n".join(lines)
+        self._board_render_cache = (cache_key, rendered)
+        return rendered
+
+    def _append_board_rows_mono(self, board_with_piece, lines: list):
+        """色なしのボード行を追加する
+
+        行全体をLUTの1回のファンシーインデックスでグリフ列へ変換する
+        （セル毎のPythonループ・分岐なし）。上位4行は非表示エリア。
+        """
+        for glyph_row in self._glyph_lut[board_with_piece[4:]]:
+            lines.append("║ │" + "".join(glyph_row) + "│             ║")
+
+    def _append_board_rows_color(self, board_with_piece, lines: list):
+        """色付きのボード行を追加する
+
+        隣接する同色セルは1つのSGRランにまとめ、行末に1回だけ
+        リセットを置く（セル毎の色+リセットの往復を排除）。
+        tolist()でPython intへ一括変換し、numpyスカラー経由の
+        要素アクセスとdict探索を行単位で排除する。
+        """
+        color_lut = self._color_lut
+        reset = self.RESET_COLOR
+        # 可視領域をまとめて1回のtolist()でPython intの行リストへ変換する
+        # （行毎・セル毎のnumpyスカラー経由__getitem__を排除）
+        for row in board_with_piece[4:].tolist():  # 上位4行をスキップ
+            parts = ["║ │"]
+            current_color = ''
+            for cell in row:
+                if cell == 0:
+                    if current_color:
+                        parts.append(reset)
+                        current_color = ''
+                    parts.append("  ")
+                else:
+                    desired = color_lut[cell]
+                    if desired != current_color:
+                        parts.append(desired if desired else reset)
+                        current_color = desired
+                    parts.append("██")
+            if current_color:
+                parts.append(reset)
+            parts.append("│             ║")
+            lines.append("".join(parts))
+
+    def _append_next_rows_mono(self, next_piece, lines: list):
+        """色なしの次ピースプレビュー行を追加する"""
+        for row in next_piece.shape[:4].tolist():  # 最大4行表示
+            parts = ["║ "]
+            visible_len = 2  # "║ " の分
+            for cell in row:
+                parts.append("██" if cell != 0 else "  ")
+                visible_len += 2
+            parts.append(" " * (32 - visible_len + 2))
+            parts.append(" ║")
+            lines.append("".join(parts))
+
+    def _append_next_rows_color(self, next_piece, lines: list):
+        """色付きの次ピースプレビュー行を追加する
+
+        色はラン単位でまとめて発行する（セル毎のSGR+リセットペアを
+        排除）。見かけ幅は構築しながら整数で数え、エスケープを
+        str.replaceで剥がして測り直す必要をなくしている。
+        """
+        piece_color = self.PIECE_COLORS.get(next_piece.type, '')
+        reset = self.RESET_COLOR
+        for row in next_piece.shape[:4].tolist():  # 最大4行表示
+            # 行はリストに積んで最後にjoinする（`+=`は毎回新しい
+            # 文字列を作り得るCPython依存の最適化に頼るため）
+            parts = ["║ "]
+            visible_len = 2  # "║ " の分
+            current_color = ''
+            for cell in row:
+                if cell != 0:
+                    if piece_color != current_color:
+                        parts.append(piece_color)
+                        current_color = piece_color
+                    parts.append("██")
+                else:
+                    if current_color:
+                        parts.append(reset)
+                        current_color = ''
+                    parts.append("  ")
+                visible_len += 2
+            if current_color:
+                parts.append(reset)
+            parts.append(" " * (32 - visible_len + 2))
+            parts.append(" ║")
+            lines.append("".join(parts))
+
     def render_game_over(self, board: TetrisBoard) -> str:
-        """ゲームオーバー画面を描画"""
+        """ゲームオーバー画面を描画（同一スコアなら再構築しない）"""
+        cache_key = (board.score, board.level, board.lines_cleared)
+        if self._game_over_cache is not None and self._game_over_cache[0] == cache_key:
+            return self._game_over_cache[1]
+
         lines = []
-        
-        lines.append("╔════════════════════════════════════╗")
+
+        lines.append(_TOP)
         lines.append("║            GAME OVER               ║")
-        lines.append("╠════════════════════════════════════╣")
+        lines.append(_SEP)
         lines.append(f"║ Final Score: {board.score:<17} ║")
         lines.append(f"║ Level Reached: {board.level:<15} ║")
         lines.append(f"║ Lines Cleared: {board.lines_cleared:<15} ║")
-        lines.append("╠════════════════════════════════════╣")
-        lines.append("║                                    ║")
+        lines.append(_SEP)
+        lines.append(_EMPTY_ROW)
         lines.append("║         Press R to Restart         ║")
         lines.append("║         Press Q to Quit            ║")
-        lines.append("║                                    ║")
-        lines.append("╚════════════════════════════════════╝")
-        
-        return "\n".join(lines)
-    
+        lines.append(_EMPTY_ROW)
+        lines.append(_BOTTOM)
+
+        rendered = "\n".join(lines)
+        self._game_over_cache = (cache_key, rendered)
+        return rendered
+
     def render_start_screen(self) -> str:
-        """スタート画面を描画"""
+        """スタート画面を描画（固定文字列のためキャッシュを返す）"""
+        return self._start_screen_cache
+
+    def _build_start_screen(self) -> str:
+        """スタート画面の文字列を構築"""
         lines = []
         
-        lines.append("╔════════════════════════════════════╗")
-        lines.append("║           QoderTetris              ║")
-        lines.append("║                                    ║")
+        lines.append(_TOP)
+        lines.append(_TITLE)
+        lines.append(_EMPTY_ROW)
         lines.append("║      Gymnasium Compatible          ║")
-        lines.append("║                                    ║")
-        lines.append("╠════════════════════════════════════╣")
-        lines.append("║                                    ║")
+        lines.append(_EMPTY_ROW)
+        lines.append(_SEP)
+        lines.append(_EMPTY_ROW)
         lines.append("║      Press any key to start       ║")
-        lines.append("║                                    ║")
+        lines.append(_EMPTY_ROW)
         lines.append("║         Press Q to Quit            ║")
-        lines.append("║                                    ║")
-        lines.append("╠════════════════════════════════════╣")
-        lines.append("║ Controls:                          ║")
-        lines.append("║ A/D or ←/→: Move Left/Right        ║")
-        lines.append("║ W or ↑: Rotate                     ║")
-        lines.append("║ S or ↓: Soft Drop                  ║")
-        lines.append("║ Space: Hard Drop                   ║")
-        lines.append("║ R: Restart  Q: Quit                ║")
-        lines.append("╚════════════════════════════════════╝")
+        lines.append(_EMPTY_ROW)
+        lines.append(_SEP)
+        lines.extend(_CONTROLS)
+        lines.append(_BOTTOM)
         
         return "\n".join(lines)
     
@@ -195,28 +385,54 @@ class CUIRenderer:
             return self.render_board(board)
     
     def update_display(self, content: str):
-        """表示を更新（ちらつき防止）"""
-        if content != self.last_render:
-            self.move_cursor_to_top()
-            sys.stdout.write(content)
+        """表示を更新（ちらつき防止・変化した行だけ再描画）"""
+        # 同一フレームの再描画はwrite(2)ごと省く。render_boardのキャッシュが
+        # 同一オブジェクトを返すためis比較で先に拾い、長さ比較で文字列比較を
+        # 短絡させてからフォールバックの内容比較を行う
+        last = self.last_render
+        if content is last or (len(content) == len(last) and content == last):
+            return
+
+        # last_renderがテスト等から直接差し替えられていたら分割し直す
+        if self._last_lines_src is not last:
+            self._last_lines = last.split('\n') if last else []
+
+        # 行単位で差分を取り、変化した行だけカーソル指定で上書きする。
+        # 典型フレームでは動くピース周辺の2〜3行しか変わらないため、
+        # 全フレーム書き出しに比べ端末I/Oが1桁減る
+        old_lines = self._last_lines
+        new_lines = content.split('\n')
+        n_old = len(old_lines)
+        parts = []
+        for i, new_line in enumerate(new_lines):
+            if i >= n_old or new_line != old_lines[i]:
+                parts.append(f"\033[{i + 1};1H\033[K{new_line}")
+        # フレームが縮んだ場合は余った旧行を消す
+        for i in range(len(new_lines), n_old):
+            parts.append(f"\033[{i + 1};1H\033[K")
+        payload = "".join(parts)
+
+        if self._stdout_fd is not None:
+            # 差分をまとめて1回のwrite(2)で書き切る
+            sys.stdout.flush()
+            os.write(self._stdout_fd, payload.encode('utf-8'))
+        elif self._stdout_buffer is not None:
+            # バイト層へ1回で書く（テキストラッパのencodeパスを回避）
+            self._stdout_buffer.write(payload.encode('utf-8'))
+            self._stdout_buffer.flush()
+        else:
+            sys.stdout.write(payload)
             sys.stdout.flush()
-            self.last_render = content
+        self.last_render = content
+        self._last_lines = new_lines
+        self._last_lines_src = content
     
     def initialize_display(self):
-        """表示初期化"""
-        self.clear_screen()
-        # カーソルを非表示に（対応している場合）
-        try:
-            sys.stdout.write('\033[?25l')
-            sys.stdout.flush()
-        except:
-            pass
+        """表示初期化（クリア・ホーム・カーソル非表示を1回で書く）"""
+        if self._is_tty:
+            self._write_bytes(b'\033[2J\033[H\033[?25l')
     
     def cleanup_display(self):
-        """表示クリーンアップ"""
-        # カーソルを表示に戻す
-        try:
-            sys.stdout.write('\033[?25h')
-            sys.stdout.flush()
-        except:
-            pass
\ No newline at end of file
+        """表示クリーンアップ（カーソルを表示に戻す）"""
+        if self._is_tty:
+            self._write_bytes(b'\033[?25h')
\ No newline at end of file